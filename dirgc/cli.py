@@ -19,6 +19,7 @@ from .browser import (
     wait_for_block_ui_clear,
 )
 from .credentials import load_credentials
+from .excel import validate_row_range
 from .logging_utils import log_info, log_warn
 from .processor import process_excel_rows
 from .recap import run_recap
@@ -301,15 +302,6 @@ def build_parser():
     return parser
 
 
-def validate_row_range(start_row, end_row):
-    if start_row is not None and start_row < 1:
-        raise ValueError("--start must be >= 1.")
-    if end_row is not None and end_row < 1:
-        raise ValueError("--end must be >= 1.")
-    if start_row is not None and end_row is not None and start_row > end_row:
-        raise ValueError("--start must be <= --end.")
-
-
 def run_dirgc(
     *,
     headless=False,
@@ -88,6 +88,15 @@ def normalize_hasil_gc(value):
     return None
 
 
+def validate_row_range(start_row, end_row):
+    if start_row is not None and start_row < 1:
+        raise ValueError("Start row must be >= 1.")
+    if end_row is not None and end_row < 1:
+        raise ValueError("End row must be >= 1.")
+    if start_row is not None and end_row is not None and start_row > end_row:
+        raise ValueError("Start row must be <= end row.")
+
+
 def resolve_excel_path(excel_file):
     if excel_file:
         return os.path.expanduser(excel_file)
@@ -1,19 +1,34 @@
+import functools
 import json
 import os
 import re
 import sys
 import threading
 import time
-from dataclasses import dataclass
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Optional
 
-from PyQt5.QtCore import Qt, QThread, QUrl, pyqtSignal
+from PyQt5.QtCore import (
+    Qt,
+    QEvent,
+    QMargins,
+    QObject,
+    QSignalBlocker,
+    QThread,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt5.QtGui import QDesktopServices, QFont, QFontDatabase
 from PyQt5.QtWidgets import (
     QApplication,
     QBoxLayout,
     QFileDialog,
     QFormLayout,
+    QGridLayout,
     QHBoxLayout,
     QDialog,
     QFrame,
@@ -46,14 +61,15 @@ from qfluentwidgets import (
     StrongBodyLabel,
     TitleLabel,
     LineEdit,
+    qconfig,
     setFontFamilies,
     setTheme,
     setThemeColor,
 )
 
-from dirgc.cli import run_dirgc, validate_row_range
-from dirgc.logging_utils import set_log_handler
-from dirgc.resume_state import load_resume_state
+from dirgc.excel import validate_row_range
+from dirgc.logging_utils import DIVIDER, log_warn, set_log_handler
+from dirgc.resume_state import RESUME_STATE_PATH, load_resume_state
 from dirgc.settings import (
     DEFAULT_EXCEL_FILE,
     DEFAULT_IDLE_TIMEOUT_MS,
@@ -69,12 +85,15 @@ from dirgc.settings import (
 GUI_SETTINGS_PATH = os.path.join("config", "gui_settings.json")
 MAX_RECENT_EXCEL = 8
 RESPONSIVE_BREAKPOINT = 980
+RESPONSIVE_HYSTERESIS = 20
+LAYOUT_DEBOUNCE_MS = 60
 BASE_FONT_SIZE = 11
 DEFAULT_FONT_SCALE = 100
 FONT_SCALE_OPTIONS = (100, 110, 120, 125)
-FONT_BASE_PX_PROPERTY = "font_base_px"
+_FONT_SCALE_SET = frozenset(FONT_SCALE_OPTIONS)
 FONT_BASE_PT_PROPERTY = "font_base_pt"
 MUTED_TEXT_COLOR = "#4A4A4A"
+THEME_COLOR = "#0078D4"
 RATE_LIMIT_SETTINGS_KEY = "rate_limit"
 MIN_FONT_SIZE_PT = 10.0
 ADVANCED_SETTINGS_KEY = "advanced"
@@ -82,20 +101,128 @@ IDLE_TIMEOUT_MIN_S = 30
 IDLE_TIMEOUT_MAX_S = 3600 * 6
 WEB_TIMEOUT_MIN_S = 10
 WEB_TIMEOUT_MAX_S = 600
+SETTINGS_SAVE_DELAY_MS = 250
+LOG_FLUSH_INTERVAL_MS = 30
+LOG_MAX_BLOCKS = 10000
+PROGRESS_REFRESH_INTERVAL_MS = 50
+DEFERRED_PAGE_BUILD_MS = 500
+_MUTED_STYLE = f"color: {MUTED_TEXT_COLOR};"
+_FOOTER_STYLE = (
+    f"color: {MUTED_TEXT_COLOR};"
+    f"QLabel a {{ color: {MUTED_TEXT_COLOR}; text-decoration: none; }}"
+    "QLabel a:hover { text-decoration: underline; }"
+)
+_ZERO_MARGINS = QMargins(0, 0, 0, 0)
+_RL_KEYS = frozenset(key.lower() for key in RATE_LIMIT_PROFILES)
+_COOLDOWN_HANDLERS = {
+    "Cooldown aktif; menunggu sebelum lanjut.": "_on_cooldown_waiting",
+    "Cooldown aktif; menghentikan proses.": "_on_cooldown_stopped",
+    "Server meminta jeda sebelum ": "_on_server_pause",
+    "Cooldown selesai; melanjutkan proses.": "_on_cooldown_finished",
+}
+_COOLDOWN_RE = re.compile("|".join(map(re.escape, _COOLDOWN_HANDLERS)))
+
+_CWD = os.getcwd()
+_path_exists_cache = {}
+_font_scale_roots = weakref.WeakSet()
+_font_base_pt = weakref.WeakKeyDictionary()
+_applied_font_scale = None
+_gui_settings_cache = None
+_settings_writer = None
+_settings_lock = threading.Lock()
+_last_settings_text = None
+
+
+def _exists(path):
+    exists = _path_exists_cache.get(path)
+    if exists is None:
+        exists = os.path.exists(path)
+        _path_exists_cache[path] = exists
+    return exists
+
+
+def _stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 def load_gui_settings():
-    try:
-        with open(GUI_SETTINGS_PATH, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        return {}
+    global _gui_settings_cache
+    if _gui_settings_cache is None:
+        with _settings_lock:
+            if _gui_settings_cache is None:
+                try:
+                    with open(
+                        GUI_SETTINGS_PATH, "r", encoding="utf-8"
+                    ) as handle:
+                        data = json.load(handle)
+                except (FileNotFoundError, json.JSONDecodeError, OSError):
+                    data = {}
+                _gui_settings_cache = data if isinstance(data, dict) else {}
+    return _gui_settings_cache
+
+
+def _write_gui_settings_text(text):
+    os.makedirs(os.path.dirname(GUI_SETTINGS_PATH), exist_ok=True)
+    temp_path = f"{GUI_SETTINGS_PATH}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.replace(temp_path, GUI_SETTINGS_PATH)
 
 
 def save_gui_settings(data):
-    os.makedirs(os.path.dirname(GUI_SETTINGS_PATH), exist_ok=True)
-    with open(GUI_SETTINGS_PATH, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+    global _gui_settings_cache, _last_settings_text
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    with _settings_lock:
+        _gui_settings_cache = data
+        if text == _last_settings_text:
+            return
+        writer = _settings_writer
+    if writer is None:
+        _write_gui_settings_text(text)
+    else:
+        # Queue behind pending async writes so an older snapshot never wins.
+        writer.submit(_write_gui_settings_text, text).result()
+    with _settings_lock:
+        _last_settings_text = text
+
+
+def save_gui_settings_async(data):
+    global _gui_settings_cache, _settings_writer, _last_settings_text
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    with _settings_lock:
+        _gui_settings_cache = data
+        if text == _last_settings_text:
+            return
+        _last_settings_text = text
+        if _settings_writer is None:
+            _settings_writer = ThreadPoolExecutor(max_workers=1)
+        future = _settings_writer.submit(_write_gui_settings_text, text)
+    future.add_done_callback(
+        functools.partial(_on_settings_write_done, text)
+    )
+
+
+def _on_settings_write_done(text, future):
+    global _last_settings_text
+    exc = future.exception()
+    if exc is None:
+        return
+    log_warn("Gagal menyimpan pengaturan GUI.", error=str(exc))
+    with _settings_lock:
+        if _last_settings_text == text:
+            _last_settings_text = None
+
+
+def flush_gui_settings():
+    global _settings_writer
+    with _settings_lock:
+        writer = _settings_writer
+        _settings_writer = None
+    if writer is not None:
+        writer.shutdown(wait=True)
 
 
 def build_footer_label():
@@ -107,14 +234,74 @@ def build_footer_label():
     footer.setTextFormat(Qt.RichText)
     footer.setTextInteractionFlags(Qt.TextBrowserInteraction)
     footer.setOpenExternalLinks(True)
-    footer.setStyleSheet(
-        f"color: {MUTED_TEXT_COLOR};"
-        f"QLabel a {{ color: {MUTED_TEXT_COLOR}; text-decoration: none; }}"
-        "QLabel a:hover { text-decoration: underline; }"
-    )
+    footer.setStyleSheet(_FOOTER_STYLE)
     return footer
 
 
+def _stacked_for_width(width, stacked):
+    if stacked is None:
+        return width < RESPONSIVE_BREAKPOINT
+    if stacked:
+        return width < RESPONSIVE_BREAKPOINT + RESPONSIVE_HYSTERESIS
+    return width < RESPONSIVE_BREAKPOINT - RESPONSIVE_HYSTERESIS
+
+
+class ResponsiveLayout(QObject):
+    def __init__(self, widget, box_layout):
+        super().__init__(widget)
+        self._widget = widget
+        self._layout = box_layout
+        self._stacked = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(LAYOUT_DEBOUNCE_MS)
+        self._timer.timeout.connect(self._apply)
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show:
+            self._timer.stop()
+            self._stacked = None
+            self._apply()
+        elif event.type() == QEvent.Resize and self._widget.isVisible():
+            self._timer.start()
+        return False
+
+    @pyqtSlot()
+    def _apply(self):
+        stacked = _stacked_for_width(self._widget.width(), self._stacked)
+        if stacked == self._stacked:
+            return
+        self._layout.setDirection(
+            QBoxLayout.TopToBottom if stacked else QBoxLayout.LeftToRight
+        )
+        self._stacked = stacked
+
+
+def _tight(layout, spacing=0):
+    layout.setContentsMargins(_ZERO_MARGINS)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def _set_all_enabled(widgets, enabled):
+    for widget in widgets:
+        widget.setEnabled(enabled)
+
+
+def _muted(label):
+    label.setStyleSheet(_MUTED_STYLE)
+    return label
+
+
+def _add_text_blocks(layout, items):
+    for title_text, desc_text in items:
+        desc_label = _muted(CaptionLabel(desc_text))
+        desc_label.setWordWrap(True)
+        layout.addWidget(StrongBodyLabel(title_text))
+        layout.addWidget(desc_label)
+
+
 def build_scroll_area(parent):
     scroll = QScrollArea(parent)
     scroll.setWidgetResizable(True)
@@ -128,16 +315,44 @@ def build_scroll_area(parent):
     return scroll, layout
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_abspath(path):
+    return os.path.abspath(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_normpath(path):
+    return os.path.normpath(path)
+
+
+def _parse_log_fields(line):
+    fields = {}
+    if not line or "=" not in line:
+        return fields
+    for part in line.split("|"):
+        key, sep, value = part.partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        if value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        fields[key.strip()] = value.strip()
+    return fields
+
+
 def _normalize_font_scale(value):
+    if type(value) is int and value in _FONT_SCALE_SET:
+        return value
     try:
         value = int(value)
     except (TypeError, ValueError):
         return DEFAULT_FONT_SCALE
-    if value not in FONT_SCALE_OPTIONS:
+    if value not in _FONT_SCALE_SET:
         return DEFAULT_FONT_SCALE
     return value
 
 
+@functools.lru_cache(maxsize=1)
 def load_font_scale():
     data = load_gui_settings()
     ui_settings = data.get("ui", {})
@@ -152,15 +367,24 @@ def save_font_scale(value):
         data["ui"] = ui_settings
     ui_settings["font_scale"] = _normalize_font_scale(value)
     save_gui_settings(data)
+    load_font_scale.cache_clear()
 
 
-def _normalize_rate_limit_profile(value):
-    key = (value or "").strip().lower()
-    if key in RATE_LIMIT_PROFILES:
+@functools.lru_cache(maxsize=32)
+def _normalize_rate_limit_key(value):
+    key = value.strip().lower()
+    if key in _RL_KEYS:
         return key
     return DEFAULT_RATE_LIMIT_PROFILE
 
 
+def _normalize_rate_limit_profile(value):
+    if not value or not isinstance(value, str):
+        return DEFAULT_RATE_LIMIT_PROFILE
+    return _normalize_rate_limit_key(value)
+
+
+@functools.lru_cache(maxsize=1)
 def load_rate_limit_profile():
     data = load_gui_settings()
     options = data.get(RATE_LIMIT_SETTINGS_KEY, {})
@@ -178,6 +402,7 @@ def save_rate_limit_profile(value):
         data[RATE_LIMIT_SETTINGS_KEY] = options
     options["profile"] = _normalize_rate_limit_profile(value)
     save_gui_settings(data)
+    load_rate_limit_profile.cache_clear()
 
 
 def _normalize_int_setting(value, default, minimum, maximum):
@@ -200,6 +425,7 @@ def _load_legacy_timeout(data, key):
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def load_idle_timeout_s():
     data = load_gui_settings()
     advanced = data.get(ADVANCED_SETTINGS_KEY, {})
@@ -216,6 +442,7 @@ def load_idle_timeout_s():
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_web_timeout_s():
     data = load_gui_settings()
     advanced = data.get(ADVANCED_SETTINGS_KEY, {})
@@ -251,6 +478,8 @@ def save_advanced_timeouts(idle_timeout_s, web_timeout_s):
         WEB_TIMEOUT_MAX_S,
     )
     save_gui_settings(data)
+    load_idle_timeout_s.cache_clear()
+    load_web_timeout_s.cache_clear()
 
 
 def _font_point_size_for_widget(widget, font):
@@ -266,34 +495,59 @@ def _font_point_size_for_widget(widget, font):
     return pixel_size * 72.0 / dpi
 
 
+def _font_base_for_widget(widget):
+    base_pt = _font_base_pt.get(widget)
+    if base_pt is None:
+        base_pt = widget.property(FONT_BASE_PT_PROPERTY)
+        if base_pt is not None:
+            _font_base_pt[widget] = base_pt
+    return base_pt
+
+
+def _set_font_base(widget, base_pt):
+    _font_base_pt[widget] = base_pt
+    widget.setProperty(FONT_BASE_PT_PROPERTY, base_pt)
+
+
 def _apply_font_scale_to_widget(widget, font_scale):
-    base_pt = widget.property(FONT_BASE_PT_PROPERTY)
-    base_px = widget.property(FONT_BASE_PX_PROPERTY)
+    base_pt = _font_base_for_widget(widget)
     scale_factor = font_scale / 100.0
+    font = widget.font()
     if base_pt is None:
-        if base_px is not None:
-            dpi = widget.logicalDpiY() if hasattr(widget, "logicalDpiY") else 96
-            if dpi <= 0:
-                dpi = 96
-            base_pt = float(base_px) * 72.0 / dpi
-            widget.setProperty(FONT_BASE_PT_PROPERTY, base_pt)
-        else:
-            font = widget.font()
-            base_pt = _font_point_size_for_widget(widget, font)
-            if base_pt is None:
-                return
-            widget.setProperty(FONT_BASE_PT_PROPERTY, base_pt)
+        base_pt = _font_point_size_for_widget(widget, font)
+        if base_pt is None:
+            return
+        _set_font_base(widget, base_pt)
 
-    font = widget.font()
     target_pt = max(MIN_FONT_SIZE_PT, base_pt * scale_factor)
     font.setPointSizeF(target_pt)
     widget.setFont(font)
 
 
+def _apply_font_scale_to_tree(root, font_scale):
+    font_scale = _normalize_font_scale(font_scale)
+    for widget in (root, *root.findChildren(QWidget)):
+        if (
+            widget.testAttribute(Qt.WA_SetFont)
+            or _font_base_for_widget(widget) is not None
+        ):
+            _apply_font_scale_to_widget(widget, font_scale)
+            continue
+        point_size = _font_point_size_for_widget(widget, widget.font())
+        if point_size is not None:
+            _set_font_base(widget, point_size * 100.0 / font_scale)
+
+
 def apply_font_scale(app, font_scale):
+    global _applied_font_scale
     font_scale = _normalize_font_scale(font_scale)
-    for widget in QApplication.allWidgets():
-        _apply_font_scale_to_widget(widget, font_scale)
+    if font_scale == _applied_font_scale:
+        return
+    _applied_font_scale = font_scale
+    for root in tuple(_font_scale_roots):
+        _apply_font_scale_to_widget(root, font_scale)
+        for widget in root.findChildren(QWidget):
+            _apply_font_scale_to_widget(widget, font_scale)
 
     base_size = max(MIN_FONT_SIZE_PT, BASE_FONT_SIZE * (font_scale / 100.0))
     font = app.font()
@@ -301,15 +555,24 @@ def apply_font_scale(app, font_scale):
     app.setFont(font)
 
 
-def apply_app_font(app):
+@functools.lru_cache(maxsize=None)
+def _app_font_family():
     font_path = os.path.join("assets", "fonts", "Poppins-Regular.ttf")
-    if os.path.exists(font_path):
-        QFontDatabase.addApplicationFont(font_path)
-    families = QFontDatabase().families()
-    if "Poppins" in families:
-        font_family = "Poppins"
-    else:
-        font_family = "Segoe UI Variable"
+    if _exists(font_path):
+        font_id = QFontDatabase.addApplicationFont(font_path)
+        if font_id != -1 and "Poppins" in (
+            QFontDatabase.applicationFontFamilies(font_id)
+        ):
+            return "Poppins"
+    if QFontDatabase().hasFamily("Poppins"):
+        return "Poppins"
+    return "Segoe UI Variable"
+
+
+def apply_app_font(app):
+    global _applied_font_scale
+    font_family = _app_font_family()
+    _applied_font_scale = None
     app.setFont(QFont(font_family, BASE_FONT_SIZE))
     setFontFamilies([font_family, "Segoe UI Variable", "Segoe UI"])
 
@@ -325,7 +588,7 @@ class TogglePasswordLineEdit(PasswordLineEdit):
         self.setPasswordVisible(not self.isPasswordVisible())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     headless: bool
     manual_only: bool
@@ -359,7 +622,7 @@ class RunConfig:
 
 
 class RunWorker(QThread):
-    log_line = pyqtSignal(str)
+    logs_ready = pyqtSignal()
     request_close = pyqtSignal()
     finished_ok = pyqtSignal()
     failed = pyqtSignal(str)
@@ -368,25 +631,40 @@ class RunWorker(QThread):
     def __init__(self, config: RunConfig):
         super().__init__()
         self._config = config
+        self._credentials = (
+            (config.sso_username, config.sso_password)
+            if config.use_sso
+            else None
+        )
         self._close_event = threading.Event()
         self._stop_event = threading.Event()
+        self._log_lines = []
+        self._log_lock = threading.Lock()
+        self._last_progress = None
 
     def _handle_log(self, line, spacer=False, divider=False):
-        if spacer:
-            self.log_line.emit("")
-        if divider:
-            self.log_line.emit("-" * 72)
-        self.log_line.emit(line)
+        with self._log_lock:
+            notify = not self._log_lines
+            if spacer:
+                self._log_lines.append("")
+            if divider:
+                self._log_lines.append(DIVIDER)
+            self._log_lines.append(line)
+        if notify:
+            self.logs_ready.emit()
+
+    def take_log_lines(self):
+        with self._log_lock:
+            lines = self._log_lines
+            self._log_lines = []
+        return lines
 
     def run(self):
         set_log_handler(self._handle_log)
         try:
-            credentials = None
-            if self._config.use_sso:
-                credentials = (
-                    self._config.sso_username,
-                    self._config.sso_password,
-                )
+            # Imported here so Playwright loads on the worker thread.
+            from dirgc.cli import run_dirgc
+
             run_dirgc(
                 headless=self._config.headless,
                 manual_only=self._config.manual_only,
@@ -403,7 +681,7 @@ class RunWorker(QThread):
                 prefer_excel_coords=self._config.prefer_excel_coords,
                 update_mode=self._config.update_mode,
                 update_fields=self._config.update_fields,
-                credentials=credentials,
+                credentials=self._credentials,
                 rate_limit_profile=self._config.rate_limit_profile,
                 submit_mode=self._config.submit_mode,
                 session_refresh_every=self._config.session_refresh_every,
@@ -438,10 +716,51 @@ class RunWorker(QThread):
         self._stop_event.set()
 
     def _emit_progress(self, processed, total, excel_row):
-        self.progress.emit(int(processed), int(total), int(excel_row))
+        progress = (int(processed), int(total), int(excel_row))
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self.progress.emit(*progress)
+
+
+class PathCheckWorker(QThread):
+    checked = pyqtSignal(object)
+
+    def __init__(self, paths):
+        super().__init__()
+        self._paths = tuple(paths)
+
+    def run(self):
+        self.checked.emit({path: _stat_or_none(path) for path in self._paths})
 
 
 class RunPage(QWidget):
+    # (option key, switch attribute, default, visibility flag attribute)
+    _SWITCH_SETTINGS = (
+        ("keep_open", "keep_open_switch", True, "_show_keep_open"),
+        ("dirgc_only", "dirgc_only_switch", False, "_show_dirgc_only"),
+        (
+            "edit_nama_alamat",
+            "edit_nama_alamat_switch",
+            False,
+            "_show_edit_nama_alamat",
+        ),
+        (
+            "prefer_web_coords",
+            "prefer_web_coords_switch",
+            False,
+            "_show_prefer_web_coords",
+        ),
+        ("stop_on_cooldown", "stop_on_cooldown_switch", False, None),
+        (
+            "submit_via_request",
+            "submit_request_switch",
+            False,
+            "_show_submit_request",
+        ),
+        ("range_enabled", "range_switch", False, "_show_range"),
+    )
+
     def __init__(
         self,
         sso_page=None,
@@ -458,9 +777,34 @@ class RunPage(QWidget):
         settings_key="options",
     ):
         super().__init__(parent)
+        self.dirgc_only_switch = None
+        self.advanced_switch = None
+        self.advanced_container = None
+        self.progress_bar = None
         self._worker = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_settings_now)
+        self._pending_progress = None
+        self._last_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_REFRESH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._apply_pending_progress)
         self._sso_page = sso_page
-        self._recent_excels = []
+        self._controls_enabled = True
+        self._status_before_check = None
+        self._path_check = None
+        self._path_check_callback = None
+        self._start_path_checks = {}
+        self._resume_state_cache = None
+        self._resume_state_mtime = None
+        self._recent_excels = ()
+        self._recent_set = frozenset()
+        self._recent_combo_items = ()
+        self._log_dir = os.path.join(_CWD, "logs")
+        self._log_dir_label = "logs"
+        self._log_dir_ready = False
         self._update_mode_default = bool(update_mode_default)
         self._validate_gc_mode_default = bool(validate_gc_mode_default)
         self._mode_with_update_fields = (
@@ -472,6 +816,8 @@ class RunPage(QWidget):
         self._run_card_title = run_card_title
         self._settings_key = settings_key
         self._update_fields = {}
+        self._update_field_keys = ()
+        self._update_field_switches = ()
         self._cooldown_active = False
         self._show_dirgc_only = not self._mode_with_update_fields
         self._show_edit_nama_alamat = not self._mode_with_update_fields
@@ -481,8 +827,7 @@ class RunPage(QWidget):
         self._show_submit_request = not self._validate_gc_mode_default
 
         outer_layout = QVBoxLayout(self)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
+        _tight(outer_layout)
         scroll, layout = build_scroll_area(self)
         outer_layout.addWidget(scroll)
 
@@ -493,21 +838,18 @@ class RunPage(QWidget):
 
         content = QWidget()
         self._content_layout = QBoxLayout(QBoxLayout.LeftToRight, content)
-        self._content_layout.setContentsMargins(0, 0, 0, 0)
-        self._content_layout.setSpacing(16)
+        _tight(self._content_layout, 16)
 
         left_col = QWidget()
         left_layout = QVBoxLayout(left_col)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-        left_layout.setSpacing(16)
+        _tight(left_layout, 16)
         left_layout.addWidget(self._build_files_card())
         left_layout.addWidget(self._build_options_card())
         left_layout.addStretch()
 
         right_col = QWidget()
         right_layout = QVBoxLayout(right_col)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(16)
+        _tight(right_layout, 16)
         right_layout.addWidget(self._build_run_card())
         right_layout.addWidget(self._build_log_card(), stretch=1)
 
@@ -516,22 +858,9 @@ class RunPage(QWidget):
 
         layout.addWidget(content, stretch=1)
         layout.addWidget(build_footer_label())
-        self._is_stacked = False
-        self._update_layout_mode(self.width())
+        self._responsive = ResponsiveLayout(self, self._content_layout)
         self._load_settings()
 
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._update_layout_mode(event.size().width())
-
-    def _update_layout_mode(self, width):
-        stacked = width < RESPONSIVE_BREAKPOINT
-        if stacked == self._is_stacked:
-            return
-        direction = QBoxLayout.TopToBottom if stacked else QBoxLayout.LeftToRight
-        self._content_layout.setDirection(direction)
-        self._is_stacked = stacked
-
     def _build_files_card(self):
         card = CardWidget()
         card_layout = QVBoxLayout(card)
@@ -554,8 +883,7 @@ class RunPage(QWidget):
 
         excel_row = QWidget()
         excel_layout = QHBoxLayout(excel_row)
-        excel_layout.setContentsMargins(0, 0, 0, 0)
-        excel_layout.setSpacing(8)
+        _tight(excel_layout, 8)
         excel_layout.addWidget(self.excel_input, stretch=1)
         excel_layout.addWidget(self.excel_browse)
 
@@ -631,7 +959,9 @@ class RunPage(QWidget):
                 "alamat": SwitchButton(),
                 "koordinat": SwitchButton(),
             }
-            for switch in self._update_fields.values():
+            self._update_field_keys = tuple(self._update_fields)
+            self._update_field_switches = tuple(self._update_fields.values())
+            for switch in self._update_field_switches:
                 switch.setChecked(True)
 
             card_layout.addWidget(
@@ -681,8 +1011,7 @@ class RunPage(QWidget):
 
         range_row = QWidget()
         range_layout = QHBoxLayout(range_row)
-        range_layout.setContentsMargins(0, 0, 0, 0)
-        range_layout.setSpacing(8)
+        _tight(range_layout, 8)
 
         self.range_switch = SwitchButton()
         self.range_switch.setChecked(False)
@@ -695,8 +1024,7 @@ class RunPage(QWidget):
 
         range_inputs = QWidget()
         range_inputs_layout = QHBoxLayout(range_inputs)
-        range_inputs_layout.setContentsMargins(0, 0, 0, 0)
-        range_inputs_layout.setSpacing(12)
+        _tight(range_inputs_layout, 12)
 
         self.start_spin = QSpinBox()
         self.start_spin.setRange(1, 1000000)
@@ -728,8 +1056,7 @@ class RunPage(QWidget):
 
         self.advanced_container = QWidget()
         advanced_layout = QVBoxLayout(self.advanced_container)
-        advanced_layout.setContentsMargins(0, 0, 0, 0)
-        advanced_layout.setSpacing(8)
+        _tight(advanced_layout, 8)
 
         self.stop_on_cooldown_switch = SwitchButton()
         self.stop_on_cooldown_switch.setChecked(False)
@@ -754,33 +1081,16 @@ class RunPage(QWidget):
         if not self._show_submit_request:
             self.submit_request_switch.setChecked(False)
 
-        refresh_row = QWidget()
-        refresh_layout = QHBoxLayout(refresh_row)
-        refresh_layout.setContentsMargins(0, 0, 0, 0)
-        refresh_layout.setSpacing(12)
-
-        refresh_text = QWidget()
-        refresh_text_layout = QVBoxLayout(refresh_text)
-        refresh_text_layout.setContentsMargins(0, 0, 0, 0)
-        refresh_text_layout.setSpacing(4)
-
-        refresh_title = StrongBodyLabel("Auto refresh session")
-        refresh_desc = CaptionLabel(
-            "Refresh session tiap N submit sukses. 0 = nonaktif."
-        )
-        refresh_desc.setWordWrap(True)
-        refresh_desc.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
-
-        refresh_text_layout.addWidget(refresh_title)
-        refresh_text_layout.addWidget(refresh_desc)
-
         self.session_refresh_spin = QSpinBox()
         self.session_refresh_spin.setRange(0, 1000000)
         self.session_refresh_spin.setValue(DEFAULT_SESSION_REFRESH_EVERY)
-
-        refresh_layout.addWidget(refresh_text, stretch=1)
-        refresh_layout.addWidget(self.session_refresh_spin)
-        advanced_layout.addWidget(refresh_row)
+        advanced_layout.addWidget(
+            self._make_option_row(
+                "Auto refresh session",
+                "Refresh session tiap N submit sukses. 0 = nonaktif.",
+                self.session_refresh_spin,
+            )
+        )
 
         self.keep_open_switch = SwitchButton()
         self.keep_open_switch.setChecked(True)
@@ -793,6 +1103,37 @@ class RunPage(QWidget):
         keep_open_row.setVisible(self._show_keep_open)
 
         card_layout.addWidget(self.advanced_container)
+
+        self._dirgc_only_controls = (
+            self.excel_input,
+            self.excel_browse,
+            self.recent_combo,
+            self.resume_button,
+            self.range_switch,
+            self.edit_nama_alamat_switch,
+            self.prefer_web_coords_switch,
+            self.stop_on_cooldown_switch,
+            self.submit_request_switch,
+            self.session_refresh_spin,
+            *self._update_field_switches,
+        )
+        self._toggleable_controls = (
+            self.excel_input,
+            self.excel_browse,
+            self.recent_combo,
+            self.resume_button,
+            self.advanced_switch,
+            self.keep_open_switch,
+            self.stop_on_cooldown_switch,
+            self.dirgc_only_switch,
+            self.edit_nama_alamat_switch,
+            self.prefer_web_coords_switch,
+            self.range_switch,
+            self.start_spin,
+            self.end_spin,
+            *self._update_field_switches,
+        )
+
         self._toggle_advanced()
 
         self._toggle_dirgc_only()
@@ -806,8 +1147,7 @@ class RunPage(QWidget):
 
         button_row = QWidget()
         button_layout = QHBoxLayout(button_row)
-        button_layout.setContentsMargins(0, 0, 0, 0)
-        button_layout.setSpacing(8)
+        _tight(button_layout, 8)
 
         self.run_button = PrimaryPushButton(self._run_label)
         self.run_button.clicked.connect(self._confirm_start)
@@ -820,11 +1160,12 @@ class RunPage(QWidget):
 
         self.status_label = BodyLabel("Status: idle")
         self.progress_label = CaptionLabel("Progress: -")
-        self.progress_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(self.progress_label)
         self.cooldown_label = CaptionLabel("Cooldown: -")
-        self.cooldown_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(self.cooldown_label)
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
+        self._progress_maximum = 100
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
         card_layout.addWidget(self.status_label)
@@ -840,8 +1181,7 @@ class RunPage(QWidget):
         card_layout = QVBoxLayout(card)
         header = QWidget()
         header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        header_layout.setSpacing(8)
+        _tight(header_layout, 8)
         header_layout.addWidget(SubtitleLabel("Log"))
         header_layout.addStretch()
         self.open_log_button = PushButton("Buka folder log")
@@ -855,31 +1195,36 @@ class RunPage(QWidget):
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setPlaceholderText("Log proses akan muncul di sini.")
+        self.log_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_output.document().setUndoRedoEnabled(False)
+        self._log_autoscroll = True
+        self.log_output.verticalScrollBar().valueChanged.connect(
+            self._on_log_scrolled
+        )
         card_layout.addWidget(self.log_output)
 
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
         return card
 
-    def _make_option_row(self, title, description, switch):
+    def _make_option_row(self, title, description, control):
         row = QWidget()
-        layout = QHBoxLayout(row)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(12)
-
-        text_block = QWidget()
-        text_layout = QVBoxLayout(text_block)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(4)
+        layout = QGridLayout(row)
+        _tight(layout, 12)
+        layout.setVerticalSpacing(4)
+        layout.setColumnStretch(0, 1)
 
-        title_label = StrongBodyLabel(title)
         desc_label = CaptionLabel(description)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(desc_label)
 
-        text_layout.addWidget(title_label)
-        text_layout.addWidget(desc_label)
-
-        layout.addWidget(text_block, stretch=1)
-        layout.addWidget(switch)
+        layout.addWidget(StrongBodyLabel(title), 0, 0)
+        layout.addWidget(desc_label, 1, 0)
+        layout.addWidget(control, 0, 1, 2, 1)
         return row
 
     def _apply_default_paths(self):
@@ -888,13 +1233,13 @@ class RunPage(QWidget):
             self._set_excel_path(excel_path, push_recent=False, save=False)
 
     def _resolve_default_path(self, relative_path):
-        candidate = os.path.join(os.getcwd(), relative_path)
-        if os.path.exists(candidate):
+        candidate = os.path.join(_CWD, relative_path)
+        if _exists(candidate):
             return candidate
         return ""
 
     def _browse_file(self, input_widget, file_filter):
-        start_dir = os.getcwd()
+        start_dir = _CWD
         if input_widget.text():
             start_dir = os.path.dirname(input_widget.text())
         path, _ = QFileDialog.getOpenFileName(
@@ -927,17 +1272,28 @@ class RunPage(QWidget):
         if not path:
             return ""
         try:
-            return os.path.abspath(path)
+            return _cached_abspath(path)
         except OSError:
             return path
 
-    def _apply_resume_state(self):
-        state = load_resume_state()
-        next_row = state.get("next_row")
-        excel_file = state.get("excel_file") or ""
-        saved_at = state.get("saved_at") or ""
+    def _get_resume_state(self):
+        stat = _stat_or_none(RESUME_STATE_PATH)
+        if stat is None:
+            self._invalidate_resume_state()
+            return {}
+        mtime = stat.st_mtime_ns
+        if self._resume_state_cache is None or mtime != self._resume_state_mtime:
+            self._resume_state_cache = load_resume_state()
+            self._resume_state_mtime = mtime
+        return self._resume_state_cache
+
+    def _invalidate_resume_state(self):
+        self._resume_state_cache = None
+        self._resume_state_mtime = None
 
-        if not next_row:
+    def _apply_resume_state(self):
+        state = self._get_resume_state()
+        if not state.get("next_row"):
             InfoBar.warning(
                 title="Resume tidak tersedia",
                 content="Resume state belum ditemukan.",
@@ -946,12 +1302,25 @@ class RunPage(QWidget):
                 position=InfoBarPosition.TOP_RIGHT,
             )
             return
+        excel_file = state.get("excel_file") or ""
+        if excel_file:
+            self._check_paths(
+                (excel_file,),
+                functools.partial(self._finish_resume_state, state),
+            )
+        else:
+            self._finish_resume_state(state, {})
+
+    def _finish_resume_state(self, state, checks):
+        next_row = state.get("next_row")
+        excel_file = state.get("excel_file") or ""
+        saved_at = state.get("saved_at") or ""
 
         if self.dirgc_only_switch.isChecked():
             self.dirgc_only_switch.setChecked(False)
 
         if excel_file:
-            if not os.path.exists(excel_file):
+            if checks.get(excel_file) is None:
                 InfoBar.error(
                     title="Resume gagal",
                     content="File Excel dari resume_state tidak ditemukan.",
@@ -993,7 +1362,7 @@ class RunPage(QWidget):
     def _auto_apply_resume_state(self, config: RunConfig):
         if config.dirgc_only:
             return config
-        state = load_resume_state()
+        state = self._get_resume_state()
         next_row = state.get("next_row")
         if not next_row:
             return config
@@ -1019,7 +1388,7 @@ class RunPage(QWidget):
                 return config
         elif not excel_file:
             if state_file:
-                if not os.path.exists(state_file):
+                if self._stat_for_run(state_file) is None:
                     InfoBar.warning(
                         title="Auto-resume diabaikan",
                         content="File Excel dari resume_state tidak ditemukan.",
@@ -1028,7 +1397,7 @@ class RunPage(QWidget):
                         position=InfoBarPosition.TOP_RIGHT,
                     )
                     return config
-                config.excel_file = state_file
+                config = replace(config, excel_file=state_file)
                 self._set_excel_path(
                     state_file, push_recent=False, save=False
                 )
@@ -1042,9 +1411,10 @@ class RunPage(QWidget):
         if next_row <= 0:
             return config
 
-        config.start_row = next_row
-        if config.end_row is not None and config.end_row < next_row:
-            config.end_row = next_row
+        end_row = config.end_row
+        if end_row is not None and end_row < next_row:
+            end_row = next_row
+        config = replace(config, start_row=next_row, end_row=end_row)
 
         InfoBar.success(
             title="Auto-resume",
@@ -1055,26 +1425,75 @@ class RunPage(QWidget):
         )
         return config
 
+    def _stat_for_run(self, path):
+        return self._start_path_checks.get(path)
+
+    def _paths_to_check(self, config: RunConfig):
+        if config.dirgc_only:
+            return ()
+        if config.excel_file:
+            return (config.excel_file,)
+        state_file = self._get_resume_state().get("excel_file")
+        return (state_file,) if state_file else ()
+
+    def _check_paths(self, paths, callback):
+        self.run_button.setEnabled(False)
+        self._set_controls_enabled(False)
+        self._status_before_check = self.status_label.text()
+        self.status_label.setText("Status: memeriksa file Excel...")
+        self._path_check_callback = callback
+        self._path_check = PathCheckWorker(paths)
+        self._path_check.checked.connect(
+            self._on_paths_checked, Qt.QueuedConnection
+        )
+        self._path_check.start()
+
+    @pyqtSlot(object)
+    def _on_paths_checked(self, checks):
+        callback = self._path_check_callback
+        self._path_check_callback = None
+        self.status_label.setText(self._status_before_check)
+        self._set_controls_enabled(True)
+        self.run_button.setEnabled(True)
+        callback(checks)
+
     def _push_recent_excel(self, path):
-        normalized = os.path.normpath(path)
+        normalized = _cached_normpath(path)
         if not normalized:
             return
-        updated = [
-            item
-            for item in self._recent_excels
-            if os.path.normpath(item) != normalized
-        ]
-        updated.insert(0, normalized)
-        self._recent_excels = updated[:MAX_RECENT_EXCEL]
+        if self._recent_excels and self._recent_excels[0] == normalized:
+            return
+        rest = self._recent_excels
+        if normalized in self._recent_set:
+            rest = tuple(item for item in rest if item != normalized)
+        recents = (normalized, *rest[: MAX_RECENT_EXCEL - 1])
+        self._recent_excels = recents
+        self._recent_set = frozenset(recents)
         self._refresh_recent_combo()
 
+    def _set_recent_excels(self, paths):
+        recents = []
+        seen = set()
+        for item in paths:
+            normalized = _cached_normpath(item)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                recents.append(normalized)
+                if len(recents) >= MAX_RECENT_EXCEL:
+                    break
+        self._recent_excels = tuple(recents)
+        self._recent_set = frozenset(seen)
+
     def _refresh_recent_combo(self):
-        self.recent_combo.blockSignals(True)
-        self.recent_combo.clear()
-        if self._recent_excels:
-            self.recent_combo.addItems(self._recent_excels)
-            self.recent_combo.setCurrentIndex(-1)
-        self.recent_combo.blockSignals(False)
+        items = self._recent_excels
+        with QSignalBlocker(self.recent_combo):
+            if items is not self._recent_combo_items:
+                self._recent_combo_items = items
+                self.recent_combo.clear()
+                if items:
+                    self.recent_combo.addItems(items)
+            if items:
+                self.recent_combo.setCurrentIndex(-1)
 
     def _load_settings(self):
         data = load_gui_settings()
@@ -1083,48 +1502,26 @@ class RunPage(QWidget):
         recents = data.get("recent_excels", [])
 
         if isinstance(recents, list):
-            self._recent_excels = [
+            self._set_recent_excels(
                 item for item in recents if isinstance(item, str)
-            ]
+            )
             self._refresh_recent_combo()
 
         if isinstance(excel_path, str) and excel_path:
             self._set_excel_path(excel_path, push_recent=False, save=False)
 
-        if self._show_keep_open and "keep_open" in options:
-            self.keep_open_switch.setChecked(bool(options["keep_open"]))
-        elif self._show_keep_open:
-            self.keep_open_switch.setChecked(True)
-        else:
-            self.keep_open_switch.setChecked(False)
-        if self._show_dirgc_only and "dirgc_only" in options:
-            self.dirgc_only_switch.setChecked(bool(options["dirgc_only"]))
-        else:
-            self.dirgc_only_switch.setChecked(False)
-        if self._show_edit_nama_alamat and "edit_nama_alamat" in options:
-            self.edit_nama_alamat_switch.setChecked(
-                bool(options["edit_nama_alamat"])
-            )
-        else:
-            self.edit_nama_alamat_switch.setChecked(False)
-        if self._show_prefer_web_coords and "prefer_web_coords" in options:
-            self.prefer_web_coords_switch.setChecked(
-                bool(options["prefer_web_coords"])
-            )
-        else:
-            self.prefer_web_coords_switch.setChecked(False)
-        if "stop_on_cooldown" in options:
-            self.stop_on_cooldown_switch.setChecked(
-                bool(options["stop_on_cooldown"])
-            )
-        else:
-            self.stop_on_cooldown_switch.setChecked(False)
-        if self._show_submit_request and "submit_via_request" in options:
-            self.submit_request_switch.setChecked(
-                bool(options["submit_via_request"])
-            )
-        else:
-            self.submit_request_switch.setChecked(False)
+        blockers = [
+            QSignalBlocker(getattr(self, attr))
+            for _key, attr, _default, _visible_attr in self._SWITCH_SETTINGS
+        ]
+        if self.advanced_switch is not None:
+            blockers.append(QSignalBlocker(self.advanced_switch))
+        for key, attr, default, visible_attr in self._SWITCH_SETTINGS:
+            if visible_attr is not None and not getattr(self, visible_attr):
+                checked = False
+            else:
+                checked = bool(options.get(key, default))
+            getattr(self, attr).setChecked(checked)
         if "session_refresh_every" in options:
             try:
                 self.session_refresh_spin.setValue(
@@ -1136,7 +1533,7 @@ class RunPage(QWidget):
                 )
         else:
             self.session_refresh_spin.setValue(DEFAULT_SESSION_REFRESH_EVERY)
-        if hasattr(self, "advanced_switch"):
+        if self.advanced_switch is not None:
             advanced_active = any(
                 [
                     self.keep_open_switch.isChecked(),
@@ -1155,26 +1552,34 @@ class RunPage(QWidget):
                     for item in options.get("update_fields", [])
                     if isinstance(item, str)
                 }
-                for key, switch in self._update_fields.items():
+                for key, switch in zip(
+                    self._update_field_keys, self._update_field_switches
+                ):
                     switch.setChecked(key in fields)
             else:
-                for switch in self._update_fields.values():
+                for switch in self._update_field_switches:
                     switch.setChecked(True)
-        if self._show_range and "range_enabled" in options:
-            self.range_switch.setChecked(bool(options["range_enabled"]))
-        else:
-            self.range_switch.setChecked(False)
         if self._show_range and "start_row" in options:
             self.start_spin.setValue(int(options["start_row"]))
         if self._show_range and "end_row" in options:
             self.end_spin.setValue(int(options["end_row"]))
 
+        for blocker in blockers:
+            blocker.unblock()
+        self._toggle_advanced()
         self._toggle_dirgc_only()
 
     def _save_settings(self):
-        data = load_gui_settings()
-        data["excel_path"] = self.excel_input.text().strip()
-        data["recent_excels"] = self._recent_excels
+        self._save_timer.start()
+
+    def flush_pending_save(self):
+        if self._save_timer.isActive():
+            self._save_settings_now()
+
+    def _save_settings_now(self):
+        self._save_timer.stop()
+        excel_path = self.excel_input.text().strip()
+        recents = list(self._recent_excels)
         options = {
             "keep_open": self.keep_open_switch.isChecked(),
             "dirgc_only": self.dirgc_only_switch.isChecked(),
@@ -1188,17 +1593,21 @@ class RunPage(QWidget):
             "end_row": self.end_spin.value(),
         }
         if self._update_fields:
-            selected_fields = [
-                key
-                for key, switch in self._update_fields.items()
-                if switch.isChecked()
-            ]
-            options["update_fields"] = selected_fields
+            options["update_fields"] = self._selected_update_fields()
+        data = load_gui_settings()
+        if (
+            data.get(self._settings_key) == options
+            and data.get("excel_path") == excel_path
+            and data.get("recent_excels") == recents
+        ):
+            return
+        data["excel_path"] = excel_path
+        data["recent_excels"] = recents
         data[self._settings_key] = options
-        save_gui_settings(data)
+        save_gui_settings_async(data)
 
     def _toggle_range(self):
-        if hasattr(self, "dirgc_only_switch") and self.dirgc_only_switch.isChecked():
+        if self.dirgc_only_switch.isChecked():
             enabled = False
         else:
             enabled = self.range_switch.isChecked()
@@ -1207,21 +1616,7 @@ class RunPage(QWidget):
 
     def _toggle_dirgc_only(self):
         enabled = not self.dirgc_only_switch.isChecked()
-        for widget in [
-            self.excel_input,
-            self.excel_browse,
-            self.recent_combo,
-            self.resume_button,
-            self.range_switch,
-            self.edit_nama_alamat_switch,
-            self.prefer_web_coords_switch,
-            self.stop_on_cooldown_switch,
-            self.submit_request_switch,
-            self.session_refresh_spin,
-        ]:
-            widget.setEnabled(enabled)
-        for switch in self._update_fields.values():
-            switch.setEnabled(enabled)
+        _set_all_enabled(self._dirgc_only_controls, enabled)
         if enabled:
             self._toggle_range()
         else:
@@ -1229,121 +1624,154 @@ class RunPage(QWidget):
             self.end_spin.setEnabled(False)
 
     def _toggle_advanced(self):
-        if hasattr(self, "advanced_container"):
+        if self.advanced_container is not None:
             self.advanced_container.setVisible(
                 self.advanced_switch.isChecked()
             )
 
 
     def _clear_log(self):
+        self._log_buffer = []
         self.log_output.clear()
+        self._log_autoscroll = True
 
     def _confirm_clear_log(self):
         if self.log_output.toPlainText().strip() == "":
             return
-        if self._confirm_dialog(
+        self._confirm_dialog(
             "Bersihkan log",
             "Hapus semua log yang tampil di layar?",
-        ):
-            self._clear_log()
+            self._clear_log,
+        )
 
     def _open_log_folder(self):
-        log_dir = os.path.join(os.getcwd(), "logs")
-        os.makedirs(log_dir, exist_ok=True)
-        if not QDesktopServices.openUrl(QUrl.fromLocalFile(log_dir)):
+        if not self._log_dir_ready:
+            os.makedirs(self._log_dir, exist_ok=True)
+            self._log_dir_ready = True
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(self._log_dir)):
+            self._log_dir_ready = False
             InfoBar.error(
                 title="Gagal membuka folder",
-                content="Tidak bisa membuka folder logs.",
+                content=f"Tidak bisa membuka folder {self._log_dir_label}.",
                 duration=3000,
                 parent=self,
                 position=InfoBarPosition.TOP_RIGHT,
             )
 
+    @pyqtSlot()
+    def _drain_worker_logs(self):
+        if self._worker is None:
+            return
+        for line in self._worker.take_log_lines():
+            self._append_log(line)
+
+    @pyqtSlot(str)
     def _append_log(self, line):
         if line is None:
             return
-        self.log_output.appendPlainText(line)
-        self.log_output.verticalScrollBar().setValue(
-            self.log_output.verticalScrollBar().maximum()
-        )
+        self._log_buffer.append(line)
         self._handle_cooldown_notifications(line)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
 
-    def _extract_log_field(self, line, key):
-        if not line or not key:
-            return ""
-        pattern = rf"(?:^|\|\s){re.escape(key)}=([^|]+)"
-        match = re.search(pattern, line)
-        if not match:
-            return ""
-        value = match.group(1).strip()
-        if value.startswith('"') and value.endswith('"'):
-            value = value[1:-1]
-        return value.strip()
+    @pyqtSlot()
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        lines = self._log_buffer
+        self._log_buffer = []
+        if len(lines) > LOG_MAX_BLOCKS:
+            lines = lines[-LOG_MAX_BLOCKS:]
+        with QSignalBlocker(self.log_output):
+            self.log_output.appendPlainText("\n".join(lines))
+        if self._log_autoscroll:
+            scrollbar = self.log_output.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+
+    @pyqtSlot(int)
+    def _on_log_scrolled(self, value):
+        self._log_autoscroll = (
+            value >= self.log_output.verticalScrollBar().maximum()
+        )
 
     def _handle_cooldown_notifications(self, line):
         if not line:
             return
-        if "Cooldown aktif; menunggu sebelum lanjut." in line:
-            sisa = self._extract_log_field(line, "sisa")
-            if sisa:
-                self.cooldown_label.setText(f"Cooldown: {sisa}")
-            self._cooldown_active = True
+        match = _COOLDOWN_RE.search(line)
+        if match is None:
             return
-        if "Cooldown aktif; menghentikan proses." in line:
-            resume_at = self._extract_log_field(line, "resume_at")
-            content = (
-                "Server meminta jeda; proses dihentikan."
-                if not resume_at
-                else f"Server meminta jeda; proses dihentikan. Resume: {resume_at}"
-            )
-            self.cooldown_label.setText("Cooldown: -")
-            InfoBar.warning(
-                title="Cooldown aktif",
-                content=content,
-                duration=6000,
-                parent=self,
-                position=InfoBarPosition.TOP_RIGHT,
-            )
-            self._cooldown_active = False
+        handler = getattr(self, _COOLDOWN_HANDLERS[match.group(0)])
+        handler(line)
+
+    def _on_cooldown_waiting(self, line):
+        sisa = _parse_log_fields(line).get("sisa")
+        if sisa:
+            self.cooldown_label.setText(f"Cooldown: {sisa}")
+        self._cooldown_active = True
+
+    def _on_cooldown_stopped(self, line):
+        resume_at = _parse_log_fields(line).get("resume_at")
+        content = (
+            "Server meminta jeda; proses dihentikan."
+            if not resume_at
+            else f"Server meminta jeda; proses dihentikan. Resume: {resume_at}"
+        )
+        self.cooldown_label.setText("Cooldown: -")
+        InfoBar.warning(
+            title="Cooldown aktif",
+            content=content,
+            duration=6000,
+            parent=self,
+            position=InfoBarPosition.TOP_RIGHT,
+        )
+        self._cooldown_active = False
+
+    def _on_server_pause(self, line):
+        if self._cooldown_active:
             return
+        self._cooldown_active = True
+        fields = _parse_log_fields(line)
+        resume_at = fields.get("resume_at")
+        wait_s = fields.get("wait_s")
+        reason = fields.get("reason")
+        details = []
+        if wait_s:
+            details.append(f"Jeda {wait_s} detik")
+            self.cooldown_label.setText(f"Cooldown: {wait_s}s")
+        if resume_at:
+            details.append(f"Lanjut {resume_at}")
+        if reason and reason != "-":
+            details.append(reason)
+        content = " | ".join(details) if details else "Menunggu sesuai instruksi server."
+        InfoBar.warning(
+            title="Auto-pause aktif",
+            content=content,
+            duration=5000,
+            parent=self,
+            position=InfoBarPosition.TOP_RIGHT,
+        )
 
-        if "Server meminta jeda sebelum " in line:
-            if self._cooldown_active:
-                return
-            self._cooldown_active = True
-            resume_at = self._extract_log_field(line, "resume_at")
-            wait_s = self._extract_log_field(line, "wait_s")
-            reason = self._extract_log_field(line, "reason")
-            details = []
-            if wait_s:
-                details.append(f"Jeda {wait_s} detik")
-                self.cooldown_label.setText(f"Cooldown: {wait_s}s")
-            if resume_at:
-                details.append(f"Lanjut {resume_at}")
-            if reason and reason != "-":
-                details.append(reason)
-            content = " | ".join(details) if details else "Menunggu sesuai instruksi server."
-            InfoBar.warning(
-                title="Auto-pause aktif",
-                content=content,
-                duration=5000,
-                parent=self,
-                position=InfoBarPosition.TOP_RIGHT,
-            )
+    def _on_cooldown_finished(self, line):
+        if not self._cooldown_active:
             return
+        self._cooldown_active = False
+        self.cooldown_label.setText("Cooldown: -")
+        InfoBar.success(
+            title="Auto-resume",
+            content="Cooldown selesai. Proses dilanjutkan otomatis.",
+            duration=3000,
+            parent=self,
+            position=InfoBarPosition.TOP_RIGHT,
+        )
 
-        if "Cooldown selesai; melanjutkan proses." in line:
-            if not self._cooldown_active:
-                return
-            self._cooldown_active = False
-            self.cooldown_label.setText("Cooldown: -")
-            InfoBar.success(
-                title="Auto-resume",
-                content="Cooldown selesai. Proses dilanjutkan otomatis.",
-                duration=3000,
-                parent=self,
-                position=InfoBarPosition.TOP_RIGHT,
+    def _selected_update_fields(self):
+        return [
+            key
+            for key, switch in zip(
+                self._update_field_keys, self._update_field_switches
             )
+            if switch.isChecked()
+        ]
 
     def _build_config(self):
         excel_text = self.excel_input.text().strip()
@@ -1358,21 +1786,22 @@ class RunPage(QWidget):
 
         update_fields = None
         if self._update_fields:
-            selected = [
-                key
-                for key, switch in self._update_fields.items()
-                if switch.isChecked()
-            ]
-            update_fields = selected
+            update_fields = self._selected_update_fields()
 
         idle_timeout_s = load_idle_timeout_s()
         web_timeout_s = load_web_timeout_s()
+        rate_limit_profile = load_rate_limit_profile()
         submit_mode = (
             "request"
             if self._show_submit_request and self.submit_request_switch.isChecked()
             else "ui"
         )
         session_refresh_every = self.session_refresh_spin.value()
+        keep_open = self.keep_open_switch.isChecked()
+        dirgc_only = self.dirgc_only_switch.isChecked()
+        edit_nama_alamat = self.edit_nama_alamat_switch.isChecked()
+        prefer_web_coords = self.prefer_web_coords_switch.isChecked()
+        stop_on_cooldown = self.stop_on_cooldown_switch.isChecked()
 
         return RunConfig(
             headless=False,
@@ -1382,10 +1811,10 @@ class RunPage(QWidget):
             end_row=end_row,
             idle_timeout_ms=idle_timeout_s * 1000,
             web_timeout_s=web_timeout_s,
-            keep_open=self.keep_open_switch.isChecked(),
-            dirgc_only=self.dirgc_only_switch.isChecked(),
-            edit_nama_alamat=self.edit_nama_alamat_switch.isChecked(),
-            prefer_excel_coords=not self.prefer_web_coords_switch.isChecked(),
+            keep_open=keep_open,
+            dirgc_only=dirgc_only,
+            edit_nama_alamat=edit_nama_alamat,
+            prefer_excel_coords=not prefer_web_coords,
             update_mode=self._update_mode_default,
             update_fields=update_fields,
             validate_gc_preview=False,
@@ -1393,10 +1822,10 @@ class RunPage(QWidget):
             use_sso=use_sso,
             sso_username=sso_username,
             sso_password=sso_password,
-            rate_limit_profile=load_rate_limit_profile(),
+            rate_limit_profile=rate_limit_profile,
             submit_mode=submit_mode,
             session_refresh_every=session_refresh_every,
-            stop_on_cooldown=self.stop_on_cooldown_switch.isChecked(),
+            stop_on_cooldown=stop_on_cooldown,
             recap=False,
             recap_length=DEFAULT_RECAP_LENGTH,
             recap_output_dir=None,
@@ -1417,9 +1846,6 @@ class RunPage(QWidget):
             if not config.excel_file:
                 self._show_error("Excel file belum dipilih.")
                 return False
-            if not os.path.exists(config.excel_file):
-                self._show_error("Excel file tidak ditemukan.")
-                return False
 
         if config.use_sso:
             if config.manual_only:
@@ -1440,13 +1866,32 @@ class RunPage(QWidget):
     def _start_run(self):
         if self._worker and self._worker.isRunning():
             return
+        if self._path_check_callback is not None:
+            return
 
         config = self._build_config()
+        paths = self._paths_to_check(config)
+        if paths:
+            # A stat on a network share can hang; keep it off the GUI thread.
+            self._check_paths(
+                paths, functools.partial(self._continue_start, config)
+            )
+        else:
+            self._continue_start(config, {})
+
+    def _continue_start(self, config: RunConfig, checks):
+        self._start_path_checks = checks
         config = self._auto_apply_resume_state(config)
         if not self._validate_inputs(config):
             return
+        excel_file = None if config.dirgc_only else config.excel_file
+        if excel_file and self._stat_for_run(excel_file) is None:
+            self._show_error("Excel file tidak ditemukan.")
+            return
+        self._launch_run(config)
 
-        self._save_settings()
+    def _launch_run(self, config: RunConfig):
+        self._save_settings_now()
         self.status_label.setText("Status: running")
         self._set_running_state(True)
         self.progress_label.setText("Progress: memuat data...")
@@ -1455,29 +1900,33 @@ class RunPage(QWidget):
         self._append_log("=== START RUN ===")
 
         if isinstance(self, RecapPage):
-            self._recap_start_ts = None
+            self._recap_start_ns = None
+            self._last_percent = -1
 
         self._worker = RunWorker(config)
-        self._worker.log_line.connect(self._append_log)
-        self._worker.finished_ok.connect(self._run_finished)
-        self._worker.failed.connect(self._run_failed)
-        self._worker.request_close.connect(self._show_keep_open_dialog)
-        self._worker.progress.connect(self._update_progress)
+        for signal, slot in (
+            (self._worker.logs_ready, self._drain_worker_logs),
+            (self._worker.finished_ok, self._run_finished),
+            (self._worker.failed, self._run_failed),
+            (self._worker.request_close, self._show_keep_open_dialog),
+            (self._worker.progress, self._queue_progress),
+        ):
+            signal.connect(slot, Qt.QueuedConnection)
         self._worker.start()
 
     def _confirm_start(self):
-        if self._confirm_dialog(
+        self._confirm_dialog(
             self._confirm_start_title,
             self._confirm_start_message,
-        ):
-            self._start_run()
+            self._start_run,
+        )
 
     def _confirm_stop(self):
-        if self._confirm_dialog(
+        self._confirm_dialog(
             "Hentikan proses",
             "Proses akan dihentikan. Lanjutkan?",
-        ):
-            self._stop_run()
+            self._stop_run,
+        )
 
     def _stop_run(self):
         if not self._worker or not self._worker.isRunning():
@@ -1487,6 +1936,7 @@ class RunPage(QWidget):
         self.stop_button.setEnabled(False)
         self._worker.request_stop()
 
+    @pyqtSlot()
     def _run_finished(self):
         self._append_log("=== RUN FINISHED ===")
         self.status_label.setText("Status: idle")
@@ -1503,6 +1953,7 @@ class RunPage(QWidget):
             position=InfoBarPosition.TOP_RIGHT,
         )
 
+    @pyqtSlot(str)
     def _run_failed(self, message):
         if "Run stopped by user." in message:
             self._run_stopped()
@@ -1538,7 +1989,23 @@ class RunPage(QWidget):
             position=InfoBarPosition.TOP_RIGHT,
         )
 
+    @pyqtSlot(int, int, int)
+    def _queue_progress(self, processed, total, excel_row):
+        self._pending_progress = (processed, total, excel_row)
+
+    @pyqtSlot()
+    def _apply_pending_progress(self):
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+        self._update_progress(*pending)
+
     def _update_progress(self, processed, total, excel_row):
+        progress = (processed, total, excel_row)
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
         if total <= 0:
             self.progress_label.setText("Progress: -")
             self._set_progress_loading()
@@ -1547,19 +2014,22 @@ class RunPage(QWidget):
         if excel_row and excel_row > 0:
             text = f"{text} | Baris Excel {excel_row}"
         self.progress_label.setText(text)
-        self.progress_bar.setRange(0, int(total))
-        value = min(max(int(processed), 0), int(total))
-        self.progress_bar.setValue(value)
+        total = int(total)
+        self._set_progress_maximum(total)
+        self.progress_bar.setValue(min(max(int(processed), 0), total))
+
+    def _set_progress_maximum(self, maximum):
+        if maximum != self._progress_maximum:
+            self._progress_maximum = maximum
+            self.progress_bar.setRange(0, maximum)
 
     def _set_progress_loading(self):
-        if hasattr(self, "progress_bar"):
-            self.progress_bar.setRange(0, 0)
-            self.progress_bar.setValue(0)
+        self._set_progress_maximum(0)
+        self.progress_bar.setValue(0)
 
     def _reset_progress(self):
-        if hasattr(self, "progress_bar"):
-            self.progress_bar.setRange(0, 100)
-            self.progress_bar.setValue(0)
+        self._set_progress_maximum(100)
+        self.progress_bar.setValue(0)
 
     def _show_error(self, message):
         InfoBar.error(
@@ -1570,50 +2040,51 @@ class RunPage(QWidget):
             position=InfoBarPosition.TOP_RIGHT,
         )
 
-    def _confirm_dialog(self, title, message):
-        result = QMessageBox.question(
-            self,
+    def _confirm_dialog(self, title, message, on_yes):
+        box = QMessageBox(
+            QMessageBox.Question,
             title,
             message,
             QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
+            self,
         )
-        return result == QMessageBox.Yes
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+
+        def _finished(_result):
+            clicked = box.clickedButton()
+            if (
+                clicked is not None
+                and box.standardButton(clicked) == QMessageBox.Yes
+            ):
+                on_yes()
+
+        box.finished.connect(_finished)
+        box.open()
 
     def _set_running_state(self, running):
+        self._last_progress = None
+        if running:
+            self._progress_timer.start()
+        else:
+            self._progress_timer.stop()
+            self._pending_progress = None
+            self._invalidate_resume_state()
         self.run_button.setEnabled(not running)
         self.stop_button.setEnabled(running)
         self._set_controls_enabled(not running)
 
     def _set_controls_enabled(self, enabled):
-        widgets = [
-            self.excel_input,
-            self.excel_browse,
-            self.recent_combo,
-            self.resume_button,
-            self.advanced_switch,
-            self.keep_open_switch,
-            self.stop_on_cooldown_switch,
-            self.dirgc_only_switch,
-            self.edit_nama_alamat_switch,
-            self.prefer_web_coords_switch,
-            self.range_switch,
-            self.start_spin,
-            self.end_spin,
-        ]
-        for widget in widgets:
-            widget.setEnabled(enabled)
-        for switch in self._update_fields.values():
-            switch.setEnabled(enabled)
-
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
+        _set_all_enabled(self._toggleable_controls, enabled)
         if enabled:
             self._toggle_dirgc_only()
-        else:
-            self.start_spin.setEnabled(False)
-            self.end_spin.setEnabled(False)
-
         if self._sso_page:
             self._sso_page.set_controls_enabled(enabled)
+
+    @pyqtSlot()
     def _show_keep_open_dialog(self):
         self.status_label.setText("Status: waiting for browser close")
         dialog = QDialog(self)
@@ -1639,6 +2110,8 @@ class RunPage(QWidget):
 
 class RecapPage(RunPage):
     def __init__(self, sso_page=None, parent=None):
+        self._recap_cards_built = False
+        self._toggleable_controls = ()
         super().__init__(
             sso_page,
             parent,
@@ -1653,10 +2126,59 @@ class RecapPage(RunPage):
             confirm_message="Mulai rekap sekarang?",
             settings_key="options_recap",
         )
-        self._recap_start_ts = None
+        self._recap_start_ns = None
+        self._last_percent = -1
+        self._last_label_update_ns = 0
         self._warned_large_page_size = False
+        self._last_saved_options = None
+        self._log_dir = os.path.join(_CWD, "logs", "recap")
+        self._log_dir_label = "recap"
+
+    def showEvent(self, event):
+        if not self._recap_cards_built:
+            self._build_recap_cards()
+        super().showEvent(event)
 
     def _build_files_card(self):
+        self._files_slot = self._build_card_slot()
+        return self._files_slot
+
+    def _build_options_card(self):
+        self._options_slot = self._build_card_slot()
+        return self._options_slot
+
+    def _build_card_slot(self):
+        slot = QWidget()
+        slot_layout = QVBoxLayout(slot)
+        _tight(slot_layout)
+        return slot
+
+    def _build_recap_cards(self):
+        self._recap_cards_built = True
+        self._files_slot.layout().addWidget(self._build_output_card())
+        self._options_slot.layout().addWidget(self._build_recap_options_card())
+        font_scale = load_font_scale()
+        _apply_font_scale_to_tree(self._files_slot, font_scale)
+        _apply_font_scale_to_tree(self._options_slot, font_scale)
+        self._toggleable_controls = (
+            self.output_dir_input,
+            self.output_dir_browse,
+            self.length_spin,
+            self.sleep_spin,
+            self.retry_spin,
+            self.backup_spin,
+            self.resume_switch,
+            self.keep_open_switch,
+        )
+        self._settings_int_bindings = (
+            ("length", self.length_spin),
+            ("sleep_ms", self.sleep_spin),
+            ("max_retries", self.retry_spin),
+            ("backup_every", self.backup_spin),
+        )
+        self._load_settings()
+
+    def _build_output_card(self):
         card = CardWidget()
         card_layout = QVBoxLayout(card)
         card_layout.addWidget(SubtitleLabel("Output"))
@@ -1674,8 +2196,7 @@ class RecapPage(RunPage):
 
         output_row = QWidget()
         output_layout = QHBoxLayout(output_row)
-        output_layout.setContentsMargins(0, 0, 0, 0)
-        output_layout.setSpacing(8)
+        _tight(output_layout, 8)
         output_layout.addWidget(self.output_dir_input, stretch=1)
         output_layout.addWidget(self.output_dir_browse)
 
@@ -1683,12 +2204,12 @@ class RecapPage(RunPage):
         card_layout.addLayout(form)
 
         hint = CaptionLabel("Kosong = default logs/recap.")
-        hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(hint)
         card_layout.addWidget(hint)
 
         return card
 
-    def _build_options_card(self):
+    def _build_recap_options_card(self):
         card = CardWidget()
         card_layout = QVBoxLayout(card)
         card_layout.addWidget(SubtitleLabel("Rekap Options"))
@@ -1727,10 +2248,10 @@ class RecapPage(RunPage):
             "Page size = jumlah baris per request. Lebih besar lebih cepat, "
             "tapi lebih berat; server bisa membatasi dan otomatis turun."
         )
-        page_size_hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(page_size_hint)
         card_layout.addWidget(page_size_hint)
         status_hint = CaptionLabel("Status filter dikunci: Semua.")
-        status_hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(status_hint)
         card_layout.addWidget(status_hint)
 
         self.resume_switch = SwitchButton()
@@ -1775,17 +2296,19 @@ class RecapPage(RunPage):
             self._warned_large_page_size = False
 
     def _browse_output_dir(self):
-        start_dir = os.getcwd()
+        start_dir = _CWD
         if self.output_dir_input.text():
             start_dir = self.output_dir_input.text()
         path = QFileDialog.getExistingDirectory(
             self, "Select folder", start_dir
         )
-        if path:
+        if path and path != self.output_dir_input.text():
             self.output_dir_input.setText(path)
             self._save_settings()
 
     def _load_settings(self):
+        if not self._recap_cards_built:
+            return
         data = load_gui_settings()
         options = data.get(self._settings_key, {})
 
@@ -1794,15 +2317,11 @@ class RecapPage(RunPage):
             if isinstance(output_dir, str):
                 self.output_dir_input.setText(output_dir)
 
-            for key, widget in (
-                ("length", self.length_spin),
-                ("sleep_ms", self.sleep_spin),
-                ("max_retries", self.retry_spin),
-                ("backup_every", self.backup_spin),
-            ):
-                if key in options:
+            for key, widget in self._settings_int_bindings:
+                value = options.get(key)
+                if value is not None:
                     try:
-                        widget.setValue(int(options[key]))
+                        widget.setValue(int(value))
                     except (TypeError, ValueError):
                         pass
 
@@ -1813,8 +2332,10 @@ class RecapPage(RunPage):
             else:
                 self.keep_open_switch.setChecked(True)
 
-    def _save_settings(self):
-        data = load_gui_settings()
+    def _save_settings_now(self):
+        self._save_timer.stop()
+        if not self._recap_cards_built:
+            return
         options = {
             "output_dir": self.output_dir_input.text().strip(),
             "length": self.length_spin.value(),
@@ -1824,16 +2345,28 @@ class RecapPage(RunPage):
             "resume": self.resume_switch.isChecked(),
             "keep_open": self.keep_open_switch.isChecked(),
         }
+        if options == self._last_saved_options:
+            return
+        self._last_saved_options = options
+        data = load_gui_settings()
         data[self._settings_key] = options
-        save_gui_settings(data)
+        save_gui_settings_async(data)
 
     def _build_config(self):
         use_sso, sso_username, sso_password = self._get_sso_values()
         idle_timeout_s = load_idle_timeout_s()
         web_timeout_s = load_web_timeout_s()
 
+        rate_limit_profile = load_rate_limit_profile()
+
         output_dir = self.output_dir_input.text().strip()
         output_dir = output_dir if output_dir else None
+        keep_open = self.keep_open_switch.isChecked()
+        recap_length = self.length_spin.value()
+        recap_sleep_ms = self.sleep_spin.value()
+        recap_max_retries = self.retry_spin.value()
+        recap_backup_every = self.backup_spin.value()
+        recap_resume = self.resume_switch.isChecked()
 
         return RunConfig(
             headless=False,
@@ -1843,7 +2376,7 @@ class RecapPage(RunPage):
             end_row=None,
             idle_timeout_ms=idle_timeout_s * 1000,
             web_timeout_s=web_timeout_s,
-            keep_open=self.keep_open_switch.isChecked(),
+            keep_open=keep_open,
             dirgc_only=False,
             edit_nama_alamat=False,
             prefer_excel_coords=True,
@@ -1854,17 +2387,17 @@ class RecapPage(RunPage):
             use_sso=use_sso,
             sso_username=sso_username,
             sso_password=sso_password,
-            rate_limit_profile=load_rate_limit_profile(),
+            rate_limit_profile=rate_limit_profile,
             submit_mode="ui",
             session_refresh_every=0,
             stop_on_cooldown=False,
             recap=True,
-            recap_length=self.length_spin.value(),
+            recap_length=recap_length,
             recap_output_dir=output_dir,
-            recap_sleep_ms=self.sleep_spin.value(),
-            recap_max_retries=self.retry_spin.value(),
-            recap_backup_every=self.backup_spin.value(),
-            recap_resume=self.resume_switch.isChecked(),
+            recap_sleep_ms=recap_sleep_ms,
+            recap_max_retries=recap_max_retries,
+            recap_backup_every=recap_backup_every,
+            recap_resume=recap_resume,
         )
 
     def _validate_inputs(self, config: RunConfig):
@@ -1877,63 +2410,58 @@ class RecapPage(RunPage):
         return True
 
     def _update_progress(self, processed, total, _excel_row):
-        if self._recap_start_ts is None and processed > 0:
-            self._recap_start_ts = time.time()
+        if self._recap_start_ns is None and processed > 0:
+            self._recap_start_ns = time.monotonic_ns()
         if total <= 0:
             self.progress_label.setText("Progress: memuat data...")
             self._set_progress_loading()
             return
         percent = int(round((processed / total) * 100))
         percent = min(max(percent, 0), 100)
+        now_ns = time.monotonic_ns()
+        if (
+            percent == self._last_percent
+            and processed < total
+            and now_ns - self._last_label_update_ns < 250_000_000
+        ):
+            return
+        self._last_percent = percent
+        self._last_label_update_ns = now_ns
         eta_text = ""
         speed_text = " | Speed (rows/sec): -"
-        if self._recap_start_ts and processed > 0:
-            elapsed = max(1.0, time.time() - self._recap_start_ts)
-            rate = processed / elapsed
+        if self._recap_start_ns is not None and processed > 0:
+            elapsed_ns = max(1_000_000_000, now_ns - self._recap_start_ns)
+            rate_tenths = (
+                processed * 10_000_000_000 + elapsed_ns // 2
+            ) // elapsed_ns
             remaining = max(0, total - processed)
-            eta_s = int(remaining / rate) if rate > 0 else 0
-            hours = eta_s // 3600
-            minutes = (eta_s % 3600) // 60
-            secs = eta_s % 60
-            speed_text = f" | Speed (rows/sec): {rate:.1f}"
+            eta_s = remaining * elapsed_ns // (processed * 1_000_000_000)
+            hours, rem = divmod(eta_s, 3600)
+            minutes, secs = divmod(rem, 60)
+            rate_whole, rate_tenth = divmod(rate_tenths, 10)
+            speed_text = f" | Speed (rows/sec): {rate_whole}.{rate_tenth}"
             eta_text = (
                 f" | Estimated Time: {hours} Jam {minutes} Menit {secs} Detik"
             )
         self.progress_label.setText(
             f"Progress: {processed}/{total} ({percent}%){speed_text}{eta_text}"
         )
-        self.progress_bar.setRange(0, 100)
+        self._set_progress_maximum(100)
         self.progress_bar.setValue(percent)
 
     def _set_controls_enabled(self, enabled):
-        for widget in [
-            self.output_dir_input,
-            self.output_dir_browse,
-            self.length_spin,
-            self.sleep_spin,
-            self.retry_spin,
-            self.backup_spin,
-            self.resume_switch,
-            self.keep_open_switch,
-        ]:
-            widget.setEnabled(enabled)
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
+        _set_all_enabled(self._toggleable_controls, enabled)
         if self._sso_page:
             self._sso_page.set_controls_enabled(enabled)
 
     def _auto_apply_resume_state(self, config: RunConfig):
         return config
 
-    def _open_log_folder(self):
-        log_dir = os.path.join(os.getcwd(), "logs", "recap")
-        os.makedirs(log_dir, exist_ok=True)
-        if not QDesktopServices.openUrl(QUrl.fromLocalFile(log_dir)):
-            InfoBar.error(
-                title="Gagal membuka folder",
-                content="Tidak bisa membuka folder recap.",
-                duration=3000,
-                parent=self,
-                position=InfoBarPosition.TOP_RIGHT,
-            )
+    def _paths_to_check(self, config: RunConfig):
+        return ()
 
 
 class ValidasiGCPage(RunPage):
@@ -1956,12 +2484,72 @@ class ValidasiGCPage(RunPage):
         )
 
 
+_HOME_STEPS = (
+    (
+        "1. Siapkan Excel",
+        "Pastikan file Excel mengikuti format kolom yang disarankan.",
+    ),
+    (
+        "2. Isi Akun SSO",
+        "Buka menu Akun SSO, aktifkan switch, lalu isi username "
+        "dan password.",
+    ),
+    (
+        "3. Jalankan",
+        "Buka menu Run, pilih file Excel, atur opsi, lalu klik Mulai.",
+    ),
+    (
+        "4. Pantau hasil",
+        "Log tampil di aplikasi dan file output tersimpan di folder logs.",
+    ),
+)
+
+_HOME_NOTES = (
+    (
+        "Biarkan browser tetap terbuka - Opsi lanjutan",
+        "ON: browser tetap terbuka setelah proses selesai.",
+    ),
+    (
+        "Stop saat cooldown (simpan posisi) - Opsi lanjutan",
+        "ON: jika server meminta jeda, proses dihentikan dan baris "
+        "terakhir disimpan untuk dilanjutkan.",
+    ),
+    (
+        "Hanya sampai halaman DIRGC",
+        "ON: berhenti di halaman DIRGC tanpa filter/input dari Excel.",
+    ),
+    (
+        "Edit Nama/Alamat Usaha dari Excel",
+        "ON: aktifkan toggle edit di popup dan isi dari data Excel.",
+    ),
+    (
+        "Prioritaskan koordinat web",
+        "ON: koordinat web dipertahankan; OFF: koordinat dari Excel.",
+    ),
+    (
+        "Menu Update Data",
+        "Gunakan menu Update untuk klik Edit Hasil dan memperbarui data.",
+    ),
+    (
+        "Batas idle (detik) - Settings > Advanced",
+        "Jika tidak ada aktivitas, proses dihentikan otomatis.",
+    ),
+    (
+        "Timeout loading web (detik) - Settings > Advanced",
+        "Naikkan jika halaman sering lambat saat login atau load data.",
+    ),
+    (
+        "Batasi baris Excel",
+        "ON: hanya memproses baris Start-End dari Excel.",
+    ),
+)
+
+
 class HomePage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         outer_layout = QVBoxLayout(self)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
+        _tight(outer_layout)
         scroll, layout = build_scroll_area(self)
         outer_layout.addWidget(scroll)
 
@@ -1977,8 +2565,7 @@ class HomePage(QWidget):
 
         hero_text = QWidget()
         hero_text_layout = QVBoxLayout(hero_text)
-        hero_text_layout.setContentsMargins(0, 0, 0, 0)
-        hero_text_layout.setSpacing(6)
+        _tight(hero_text_layout, 6)
 
         title = LargeTitleLabel("DIRGC Automation")
         subtitle = BodyLabel(
@@ -1994,15 +2581,13 @@ class HomePage(QWidget):
 
         self._content_widget = QWidget()
         self._content_layout = QBoxLayout(QBoxLayout.LeftToRight)
-        self._content_layout.setContentsMargins(0, 0, 0, 0)
-        self._content_layout.setSpacing(16)
+        _tight(self._content_layout, 16)
         self._content_widget.setLayout(self._content_layout)
         layout.addWidget(self._content_widget)
 
         left_col = QWidget()
         left_layout = QVBoxLayout(left_col)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-        left_layout.setSpacing(16)
+        _tight(left_layout, 16)
 
         summary_card = CardWidget()
         summary_layout = QVBoxLayout(summary_card)
@@ -2021,91 +2606,20 @@ class HomePage(QWidget):
         steps_layout.setSpacing(6)
         steps_layout.addWidget(SubtitleLabel("Cara Pakai Singkat"))
 
-        steps = [
-            (
-                "1. Siapkan Excel",
-                "Pastikan file Excel mengikuti format kolom yang disarankan.",
-            ),
-            (
-                "2. Isi Akun SSO",
-                "Buka menu Akun SSO, aktifkan switch, lalu isi username "
-                "dan password.",
-            ),
-            (
-                "3. Jalankan",
-                "Buka menu Run, pilih file Excel, atur opsi, lalu klik Mulai.",
-            ),
-            (
-                "4. Pantau hasil",
-                "Log tampil di aplikasi dan file output tersimpan di folder logs.",
-            ),
-        ]
-        for title_text, desc_text in steps:
-            title_label = StrongBodyLabel(title_text)
-            desc_label = CaptionLabel(desc_text)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
-            steps_layout.addWidget(title_label)
-            steps_layout.addWidget(desc_label)
+        _add_text_blocks(steps_layout, _HOME_STEPS)
         left_layout.addWidget(steps_card)
         left_layout.addStretch()
 
         right_col = QWidget()
         right_layout = QVBoxLayout(right_col)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(16)
+        _tight(right_layout, 16)
 
         notes_card = CardWidget()
         notes_layout = QVBoxLayout(notes_card)
         notes_layout.setSpacing(6)
         notes_layout.addWidget(SubtitleLabel("Keterangan Opsi"))
 
-        notes = [
-            (
-                "Biarkan browser tetap terbuka - Opsi lanjutan",
-                "ON: browser tetap terbuka setelah proses selesai.",
-            ),
-            (
-                "Stop saat cooldown (simpan posisi) - Opsi lanjutan",
-                "ON: jika server meminta jeda, proses dihentikan dan baris "
-                "terakhir disimpan untuk dilanjutkan.",
-            ),
-            (
-                "Hanya sampai halaman DIRGC",
-                "ON: berhenti di halaman DIRGC tanpa filter/input dari Excel.",
-            ),
-            (
-                "Edit Nama/Alamat Usaha dari Excel",
-                "ON: aktifkan toggle edit di popup dan isi dari data Excel.",
-            ),
-            (
-                "Prioritaskan koordinat web",
-                "ON: koordinat web dipertahankan; OFF: koordinat dari Excel.",
-            ),
-            (
-                "Menu Update Data",
-                "Gunakan menu Update untuk klik Edit Hasil dan memperbarui data.",
-            ),
-            (
-                "Batas idle (detik) - Settings > Advanced",
-                "Jika tidak ada aktivitas, proses dihentikan otomatis.",
-            ),
-            (
-                "Timeout loading web (detik) - Settings > Advanced",
-                "Naikkan jika halaman sering lambat saat login atau load data.",
-            ),
-            (
-                "Batasi baris Excel",
-                "ON: hanya memproses baris Start-End dari Excel.",
-            ),
-        ]
-        for title_text, desc_text in notes:
-            title_label = StrongBodyLabel(title_text)
-            desc_label = CaptionLabel(desc_text)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
-            notes_layout.addWidget(title_label)
-            notes_layout.addWidget(desc_label)
+        _add_text_blocks(notes_layout, _HOME_NOTES)
         right_layout.addWidget(notes_card)
 
         appreciation_card = CardWidget()
@@ -2120,7 +2634,7 @@ class HomePage(QWidget):
         appreciation_message.setWordWrap(True)
         appreciation_message.setTextFormat(Qt.RichText)
         appreciation_message.setOpenExternalLinks(True)
-        appreciation_message.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(appreciation_message)
         appreciation_layout.addWidget(appreciation_message)
         right_layout.addWidget(appreciation_card)
         right_layout.addStretch()
@@ -2130,30 +2644,14 @@ class HomePage(QWidget):
 
         layout.addStretch()
         layout.addWidget(build_footer_label())
-        self._is_stacked = None
-        self._update_layout_mode(self.width())
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._update_layout_mode(event.size().width())
-
-    def _update_layout_mode(self, width):
-        stacked = width < RESPONSIVE_BREAKPOINT
-        if stacked == self._is_stacked:
-            return
-        direction = (
-            QBoxLayout.TopToBottom if stacked else QBoxLayout.LeftToRight
-        )
-        self._content_layout.setDirection(direction)
-        self._is_stacked = stacked
+        self._responsive = ResponsiveLayout(self, self._content_layout)
 
 
 class SsoPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         outer_layout = QVBoxLayout(self)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
+        _tight(outer_layout)
         scroll, layout = build_scroll_area(self)
         outer_layout.addWidget(scroll)
 
@@ -2196,23 +2694,22 @@ class SsoPage(QWidget):
         layout.addStretch()
         layout.addWidget(build_footer_label())
 
+        self._fields_enabled = None
         self.use_switch.checkedChanged.connect(self._toggle_fields)
         self._toggle_fields()
 
     def _make_toggle_row(self, text, description, switch):
         row = QWidget()
         row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(12)
+        _tight(row_layout, 12)
 
         text_block = QWidget()
         text_layout = QVBoxLayout(text_block)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(4)
+        _tight(text_layout, 4)
         text_layout.addWidget(StrongBodyLabel(text))
         hint = CaptionLabel(description)
         hint.setWordWrap(True)
-        hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(hint)
         text_layout.addWidget(hint)
 
         row_layout.addWidget(text_block, stretch=1)
@@ -2221,6 +2718,9 @@ class SsoPage(QWidget):
 
     def _toggle_fields(self):
         enabled = self.use_switch.isChecked() and self.use_switch.isEnabled()
+        if enabled == self._fields_enabled:
+            return
+        self._fields_enabled = enabled
         self.username_input.setEnabled(enabled)
         self.password_input.setEnabled(enabled)
 
@@ -2235,7 +2735,8 @@ class SsoPage(QWidget):
         return username, password
 
     def set_controls_enabled(self, enabled):
-        self.use_switch.setEnabled(enabled)
+        if enabled != self.use_switch.isEnabled():
+            self.use_switch.setEnabled(enabled)
         self._toggle_fields()
 
 
@@ -2244,8 +2745,7 @@ class SettingsPage(QWidget):
         super().__init__(parent)
         self._app = app
         outer_layout = QVBoxLayout(self)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
+        _tight(outer_layout)
         scroll, layout = build_scroll_area(self)
         outer_layout.addWidget(scroll)
 
@@ -2261,26 +2761,26 @@ class SettingsPage(QWidget):
 
         row = QWidget()
         row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(12)
+        _tight(row_layout, 12)
 
         text_block = QWidget()
         text_layout = QVBoxLayout(text_block)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(4)
+        _tight(text_layout, 4)
         text_layout.addWidget(StrongBodyLabel("Ukuran font"))
         desc_label = CaptionLabel(
             "Pilih 100/110/120/125% untuk memperbesar teks."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(desc_label)
         text_layout.addWidget(desc_label)
 
         self.font_combo = ComboBox()
         for scale in FONT_SCALE_OPTIONS:
             self.font_combo.addItem(f"{scale}%")
-        current_scale = load_font_scale()
-        index = self.font_combo.findText(f"{current_scale}%")
+        try:
+            index = FONT_SCALE_OPTIONS.index(load_font_scale())
+        except ValueError:
+            index = -1
         if index >= 0:
             self.font_combo.setCurrentIndex(index)
 
@@ -2295,19 +2795,17 @@ class SettingsPage(QWidget):
 
         idle_row = QWidget()
         idle_layout = QHBoxLayout(idle_row)
-        idle_layout.setContentsMargins(0, 0, 0, 0)
-        idle_layout.setSpacing(12)
+        _tight(idle_layout, 12)
 
         idle_label = StrongBodyLabel("Batas idle (detik)")
         idle_hint = CaptionLabel(
             "Jika tidak ada aktivitas, proses dihentikan otomatis."
         )
-        idle_hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(idle_hint)
         idle_hint.setWordWrap(True)
         idle_text = QWidget()
         idle_text_layout = QVBoxLayout(idle_text)
-        idle_text_layout.setContentsMargins(0, 0, 0, 0)
-        idle_text_layout.setSpacing(4)
+        _tight(idle_text_layout, 4)
         idle_text_layout.addWidget(idle_label)
         idle_text_layout.addWidget(idle_hint)
         self.idle_timeout_spin = QSpinBox()
@@ -2321,19 +2819,17 @@ class SettingsPage(QWidget):
 
         web_row = QWidget()
         web_layout = QHBoxLayout(web_row)
-        web_layout.setContentsMargins(0, 0, 0, 0)
-        web_layout.setSpacing(12)
+        _tight(web_layout, 12)
 
         web_label = StrongBodyLabel("Timeout loading web (detik)")
         web_hint = CaptionLabel(
             "Naikkan jika koneksi lambat atau halaman sering timeout."
         )
-        web_hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(web_hint)
         web_hint.setWordWrap(True)
         web_text = QWidget()
         web_text_layout = QVBoxLayout(web_text)
-        web_text_layout.setContentsMargins(0, 0, 0, 0)
-        web_text_layout.setSpacing(4)
+        _tight(web_text_layout, 4)
         web_text_layout.addWidget(web_label)
         web_text_layout.addWidget(web_hint)
         self.web_timeout_spin = QSpinBox()
@@ -2349,6 +2845,10 @@ class SettingsPage(QWidget):
         layout.addStretch()
         layout.addWidget(build_footer_label())
 
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_advanced_timeouts_now)
         self.font_combo.currentIndexChanged.connect(
             self._apply_font_scale
         )
@@ -2360,25 +2860,81 @@ class SettingsPage(QWidget):
         )
 
     def _apply_font_scale(self):
-        text = self.font_combo.currentText().strip()
-        text = text.replace("%", "")
-        scale = _normalize_font_scale(text)
+        index = self.font_combo.currentIndex()
+        if index < 0:
+            return
+        scale = FONT_SCALE_OPTIONS[index]
+        if scale == load_font_scale():
+            return
         save_font_scale(scale)
         apply_font_scale(self._app, scale)
 
     def _save_advanced_timeouts(self):
+        self._save_timer.start()
+
+    def flush_pending_save(self):
+        if self._save_timer.isActive():
+            self._save_advanced_timeouts_now()
+
+    def _save_advanced_timeouts_now(self):
+        self._save_timer.stop()
         save_advanced_timeouts(
             self.idle_timeout_spin.value(),
             self.web_timeout_spin.value(),
         )
 
 
+_PROFILE_KEYS = ("normal", "safe", "ultra")
+_PROFILE_LABELS = {
+    "normal": "Normal (cepat)",
+    "safe": "Safe",
+    "ultra": "Ultra",
+}
+
+_HIGHLIGHT_STYLE = "background-color: #FFF7E6; border: 1px solid #FFD666;"
+_BADGE_STYLE_TEMPLATE = (
+    "padding: 2px 8px; border-radius: 10px; "
+    "background-color: {bg}; color: {fg};"
+)
+_PROFILE_DETAIL = {
+    "normal": (
+        "Estimasi waktu: ~1x (paling cepat)",
+        _PROFILE_LABELS["normal"],
+        _BADGE_STYLE_TEMPLATE.format(bg="#E6F4FF", fg="#096DD9"),
+    ),
+    "safe": (
+        "Estimasi waktu: ~1.4–1.8x (lebih lama dari Normal)",
+        _PROFILE_LABELS["safe"],
+        _BADGE_STYLE_TEMPLATE.format(bg="#FFF7E6", fg="#FA8C16"),
+    ),
+    "ultra": (
+        "Estimasi waktu: ~2–3x (paling lama)",
+        _PROFILE_LABELS["ultra"],
+        _BADGE_STYLE_TEMPLATE.format(bg="#FFF1F0", fg="#CF1322"),
+    ),
+}
+
+_RATE_LIMIT_GUIDE_ITEMS = (
+    (
+        "Normal (cepat)",
+        "Pakai saat server relatif stabil. Estimasi waktu: ~1x.",
+    ),
+    (
+        "Safe",
+        "Pakai saat jam sibuk atau 429 sering muncul. Estimasi waktu: ~1.4–1.8x.",
+    ),
+    (
+        "Ultra",
+        "Pakai jika Safe belum cukup. Estimasi waktu: ~2–3x.",
+    ),
+)
+
+
 class RateLimitPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         outer_layout = QVBoxLayout(self)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
+        _tight(outer_layout)
         scroll, layout = build_scroll_area(self)
         layout.setSpacing(12)
         outer_layout.addWidget(scroll)
@@ -2393,9 +2949,7 @@ class RateLimitPage(QWidget):
         layout.addWidget(subtitle)
 
         highlight_card = CardWidget()
-        highlight_card.setStyleSheet(
-            "background-color: #FFF7E6; border: 1px solid #FFD666;"
-        )
+        highlight_card.setStyleSheet(_HIGHLIGHT_STYLE)
         highlight_layout = QHBoxLayout(highlight_card)
         highlight_layout.setContentsMargins(14, 10, 14, 10)
         highlight_layout.setSpacing(10)
@@ -2407,8 +2961,7 @@ class RateLimitPage(QWidget):
 
         highlight_text = QWidget()
         highlight_text_layout = QVBoxLayout(highlight_text)
-        highlight_text_layout.setContentsMargins(0, 0, 0, 0)
-        highlight_text_layout.setSpacing(4)
+        _tight(highlight_text_layout, 4)
         highlight_title = StrongBodyLabel("Sering gagal submit?")
         highlight_desc = BodyLabel(
             "Jika muncul pesan 'Something Went Wrong' saat submit, "
@@ -2427,48 +2980,35 @@ class RateLimitPage(QWidget):
 
         row = QWidget()
         row_layout = QVBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(4)
+        _tight(row_layout, 4)
 
         title_label = StrongBodyLabel("Profil kecepatan")
         hint = CaptionLabel(
             "Semakin aman, proses makin lama tetapi 429 lebih jarang."
         )
         hint.setWordWrap(True)
-        hint.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(hint)
 
         self.profile_combo = ComboBox()
-        self._profile_keys = ["normal", "safe", "ultra"]
-        self._profile_labels = {
-            "normal": "Normal (cepat)",
-            "safe": "Safe",
-            "ultra": "Ultra",
-        }
-        for key in self._profile_keys:
-            self.profile_combo.addItem(
-                self._profile_labels.get(key, key)
-            )
+        for key in _PROFILE_KEYS:
+            self.profile_combo.addItem(_PROFILE_LABELS.get(key, key))
 
         row_layout.addWidget(title_label)
         row_layout.addWidget(hint)
         row_layout.addWidget(self.profile_combo, alignment=Qt.AlignLeft)
         badge_row = QWidget()
         badge_layout = QHBoxLayout(badge_row)
-        badge_layout.setContentsMargins(0, 0, 0, 0)
-        badge_layout.setSpacing(8)
+        _tight(badge_layout, 8)
         badge_label = CaptionLabel("Mode aktif")
-        badge_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(badge_label)
         self.active_badge = CaptionLabel("-")
-        self.active_badge.setStyleSheet(
-            "padding: 2px 8px; border-radius: 10px;"
-        )
         badge_layout.addWidget(badge_label)
         badge_layout.addWidget(self.active_badge)
         badge_layout.addStretch()
         row_layout.addWidget(badge_row)
 
         self.estimate_label = CaptionLabel("Estimasi waktu: -")
-        self.estimate_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
+        _muted(self.estimate_label)
         row_layout.addWidget(self.estimate_label)
         select_layout.addWidget(row)
         layout.addWidget(select_card)
@@ -2477,27 +3017,7 @@ class RateLimitPage(QWidget):
         guide_layout = QVBoxLayout(guide_card)
         guide_layout.setSpacing(4)
         guide_layout.addWidget(SubtitleLabel("Keterangan"))
-        guide_items = [
-            (
-                "Normal (cepat)",
-                "Pakai saat server relatif stabil. Estimasi waktu: ~1x.",
-            ),
-            (
-                "Safe",
-                "Pakai saat jam sibuk atau 429 sering muncul. Estimasi waktu: ~1.4–1.8x.",
-            ),
-            (
-                "Ultra",
-                "Pakai jika Safe belum cukup. Estimasi waktu: ~2–3x.",
-            ),
-        ]
-        for title_text, desc_text in guide_items:
-            title_label = StrongBodyLabel(title_text)
-            desc_label = CaptionLabel(desc_text)
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet(f"color: {MUTED_TEXT_COLOR};")
-            guide_layout.addWidget(title_label)
-            guide_layout.addWidget(desc_label)
+        _add_text_blocks(guide_layout, _RATE_LIMIT_GUIDE_ITEMS)
         layout.addWidget(guide_card)
 
         note_card = CardWidget()
@@ -2524,58 +3044,34 @@ class RateLimitPage(QWidget):
 
     def _load_profile(self):
         selected = load_rate_limit_profile()
-        if selected in self._profile_keys:
+        if selected in _PROFILE_KEYS:
             self.profile_combo.setCurrentIndex(
-                self._profile_keys.index(selected)
+                _PROFILE_KEYS.index(selected)
             )
         self._update_detail(selected)
 
     def _apply_profile_selection(self):
         index = self.profile_combo.currentIndex()
-        if index < 0 or index >= len(self._profile_keys):
+        if index < 0 or index >= len(_PROFILE_KEYS):
             return
-        key = self._profile_keys[index]
+        key = _PROFILE_KEYS[index]
         save_rate_limit_profile(key)
         self._update_detail(key)
 
     def _update_detail(self, key):
-        if key == "safe":
-            estimate = "Estimasi waktu: ~1.4–1.8x (lebih lama dari Normal)"
-            self._set_badge_style(
-                "#FA8C16",
-                "#FFF7E6",
-                self._profile_labels.get("safe", "Safe"),
-            )
-        elif key == "ultra":
-            estimate = "Estimasi waktu: ~2–3x (paling lama)"
-            self._set_badge_style(
-                "#CF1322",
-                "#FFF1F0",
-                self._profile_labels.get("ultra", "Ultra"),
-            )
-        else:
-            estimate = "Estimasi waktu: ~1x (paling cepat)"
-            self._set_badge_style(
-                "#096DD9",
-                "#E6F4FF",
-                self._profile_labels.get("normal", "Normal"),
-            )
-        self.estimate_label.setText(estimate)
-
-    def _set_badge_style(self, text_color, bg_color, label):
-        self.active_badge.setText(label)
-        self.active_badge.setStyleSheet(
-            "padding: 2px 8px; border-radius: 10px; "
-            f"background-color: {bg_color}; color: {text_color};"
+        estimate, label, badge_style = _PROFILE_DETAIL.get(
+            key, _PROFILE_DETAIL["normal"]
         )
+        self.active_badge.setText(label)
+        self.active_badge.setStyleSheet(badge_style)
+        self.estimate_label.setText(estimate)
 
 
 class PlaceholderPage(QWidget):
     def __init__(self, title, parent=None):
         super().__init__(parent)
         outer_layout = QVBoxLayout(self)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
+        _tight(outer_layout)
         scroll, layout = build_scroll_area(self)
         outer_layout.addWidget(scroll)
         layout.addWidget(TitleLabel(title))
@@ -2584,6 +3080,40 @@ class PlaceholderPage(QWidget):
         layout.addWidget(build_footer_label())
 
 
+class LazyPage(QWidget):
+    def __init__(self, factory, object_name, parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+        self._factory = factory
+        self.page = None
+        layout = QVBoxLayout(self)
+        _tight(layout)
+
+    def showEvent(self, event):
+        if self.page is None:
+            self.build()
+        super().showEvent(event)
+
+    def build(self):
+        if self.page is None:
+            self.page = self._factory(self)
+            self.layout().addWidget(self.page)
+            _apply_font_scale_to_tree(self.page, load_font_scale())
+        return self.page
+
+
+_NAV_ITEMS = (
+    ("home_page", FIF.HOME, "Beranda", False),
+    ("sso_page", FIF.PEOPLE, "Akun SSO", False),
+    ("run_page", FIF.PLAY, "Run", False),
+    ("update_page", FIF.EDIT, "Update", False),
+    ("validasi_gc_page", FIF.CHECKBOX, "Validasi GC", False),
+    ("recap_page", FIF.DOCUMENT, "Recap", False),
+    ("rate_limit_page", FIF.INFO, "Mode Stabilitas", False),
+    ("settings_page", FIF.SETTING, "Settings", True),
+)
+
+
 class MainWindow(FluentWindow):
     def __init__(self, app):
         super().__init__()
@@ -2592,71 +3122,107 @@ class MainWindow(FluentWindow):
         self.setWindowTitle("DIRGC Automation")
         self.resize(1100, 720)
 
-        self.home_page = HomePage(self)
+        # SsoPage stays eager because the run pages read its credentials.
+        self.home_page = LazyPage(HomePage, "home_page", self)
         self.sso_page = SsoPage(self)
-        self.run_page = RunPage(self.sso_page, self)
-        self.update_page = RunPage(
-            self.sso_page,
-            self,
-            update_mode_default=True,
-            title_text="Update Data",
-            subtitle_text="Perbarui data di DIRGC berdasarkan Excel.",
-            run_label="Update",
-            run_card_title="Update",
-            confirm_title="Mulai update",
-            confirm_message="Mulai update sekarang?",
-            settings_key="options_update",
-        )
-        self.validasi_gc_page = ValidasiGCPage(self.sso_page, self)
-        self.recap_page = RecapPage(self.sso_page, self)
-        self.settings_page = SettingsPage(self._app, self)
-        self.rate_limit_page = RateLimitPage(self)
-        self.home_page.setObjectName("home_page")
-        self.run_page.setObjectName("run_page")
         self.sso_page.setObjectName("sso_page")
-        self.update_page.setObjectName("update_page")
-        self.validasi_gc_page.setObjectName("validasi_gc_page")
-        self.recap_page.setObjectName("recap_page")
-        self.settings_page.setObjectName("settings_page")
-        self.rate_limit_page.setObjectName("rate_limit_page")
-
-        self.addSubInterface(self.home_page, FIF.HOME, "Beranda")
-        self.addSubInterface(self.sso_page, FIF.PEOPLE, "Akun SSO")
-        self.addSubInterface(self.run_page, FIF.PLAY, "Run")
-        self.addSubInterface(self.update_page, FIF.EDIT, "Update")
-        self.addSubInterface(self.validasi_gc_page, FIF.CHECKBOX, "Validasi GC")
-        self.addSubInterface(self.recap_page, FIF.DOCUMENT, "Recap")
-        self.addSubInterface(
-            self.rate_limit_page, FIF.INFO, "Mode Stabilitas"
-        )
-        self.addSubInterface(
+        self.run_page = LazyPage(
+            lambda parent: RunPage(self.sso_page, parent),
+            "run_page",
+            self,
+        )
+        self.update_page = LazyPage(
+            lambda parent: RunPage(
+                self.sso_page,
+                parent,
+                update_mode_default=True,
+                title_text="Update Data",
+                subtitle_text="Perbarui data di DIRGC berdasarkan Excel.",
+                run_label="Update",
+                run_card_title="Update",
+                confirm_title="Mulai update",
+                confirm_message="Mulai update sekarang?",
+                settings_key="options_update",
+            ),
+            "update_page",
+            self,
+        )
+        self.validasi_gc_page = LazyPage(
+            lambda parent: ValidasiGCPage(self.sso_page, parent),
+            "validasi_gc_page",
+            self,
+        )
+        self.recap_page = LazyPage(
+            lambda parent: RecapPage(self.sso_page, parent),
+            "recap_page",
+            self,
+        )
+        self.settings_page = LazyPage(
+            lambda parent: SettingsPage(self._app, parent),
+            "settings_page",
+            self,
+        )
+        self.rate_limit_page = LazyPage(
+            RateLimitPage, "rate_limit_page", self
+        )
+
+        for attr, icon, label, at_bottom in _NAV_ITEMS:
+            page = getattr(self, attr)
+            if at_bottom:
+                self.addSubInterface(
+                    page, icon, label, NavigationItemPosition.BOTTOM
+                )
+            else:
+                self.addSubInterface(page, icon, label)
+        self._run_pages = (
+            self.run_page,
+            self.update_page,
+            self.validasi_gc_page,
+            self.recap_page,
+        )
+        self._deferred_pages = self._run_pages + (
+            self.rate_limit_page,
             self.settings_page,
-            FIF.SETTING,
-            "Settings",
-            NavigationItemPosition.BOTTOM,
         )
 
+    def _build_deferred_pages(self):
+        for lazy_page in self._deferred_pages:
+            if lazy_page.page is None:
+                lazy_page.build()
+                QTimer.singleShot(
+                    DEFERRED_PAGE_BUILD_MS, self._build_deferred_pages
+                )
+                return
+
+    def _flush_pending_saves(self):
+        for lazy_page in self._run_pages + (self.settings_page,):
+            page = lazy_page.page
+            if page is not None:
+                page.flush_pending_save()
+
     def closeEvent(self, event):
-        if self.run_page:
-            self.run_page._save_settings()
-        if self.update_page:
-            self.update_page._save_settings()
-        if self.validasi_gc_page:
-            self.validasi_gc_page._save_settings()
-        if self.recap_page:
-            self.recap_page._save_settings()
+        self._flush_pending_saves()
+        flush_gui_settings()
         super().closeEvent(event)
 
 
 def main():
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     apply_app_font(app)
-    setTheme(Theme.LIGHT)
-    setThemeColor("#0078D4")
+    if qconfig.theme != Theme.LIGHT:
+        setTheme(Theme.LIGHT)
+    if qconfig.get(qconfig.themeColor).name().lower() != THEME_COLOR.lower():
+        setThemeColor(THEME_COLOR)
 
+    font_scale = load_font_scale()
+    apply_font_scale(app, font_scale)
     window = MainWindow(app)
-    apply_font_scale(app, load_font_scale())
+    _apply_font_scale_to_tree(window, font_scale)
+    _font_scale_roots.add(window)
     window.show()
+    QTimer.singleShot(DEFERRED_PAGE_BUILD_MS, window._build_deferred_pages)
+    app.aboutToQuit.connect(window._flush_pending_saves)
+    app.aboutToQuit.connect(flush_gui_settings)
     sys.exit(app.exec_())
 
 
@@ -22,6 +22,7 @@ FIELD_ORDER = (
     "path",
 )
 DIVIDER_LEN = 72
+DIVIDER = "-" * DIVIDER_LEN
 LEVEL_COLORS = {
     "INFO": "\x1b[32m",
     "WARN": "\x1b[33m",
@@ -86,7 +87,7 @@ def log(level, message, **fields):
     if spacer:
         print()
     if divider:
-        print("-" * DIVIDER_LEN)
+        print(DIVIDER)
     if suffix:
         print(f"[{timestamp}] {level_text}: {message} | {suffix}")
     else: